@@ -4,12 +4,57 @@
 """
 
 import os
+import select
 import sys
-from typing import List, Optional
+import time
+from typing import List, Optional, Tuple
 
-from game_types import GamePhase, PlayerAction, PlayerStatus, format_chips, format_action
-from texas_holdem import TexasHoldemGame
-from player import Player
+from Poker.holdem.texas_holdem_evaluator import texas_evaluator
+
+from .game_types import GamePhase, PlayerAction, PlayerStatus, Position, format_chips, format_action
+from .texas_holdem import TexasHoldemGame
+from .player import Player
+
+
+# 光标归位 + 清屏 + 清除滚动缓冲区
+_CLEAR_SCREEN = "\x1b[H\x1b[2J\x1b[3J"
+
+# 分隔线和标题(预先拼接好，避免每次重复构造)
+_SEPARATOR = "=" * 60
+_HAND_RESULT_HEADER = "\\n" + "=" * 30 + " 手牌结果 " + "=" * 30
+_GAME_SUMMARY_HEADER = "\\n" + "=" * 25 + " 游戏结束 " + "=" * 25
+
+# 游戏阶段显示名称
+_PHASE_NAMES = {
+    GamePhase.WAITING: "等待开始",
+    GamePhase.PREFLOP: "翻牌前",
+    GamePhase.FLOP: "翻牌",
+    GamePhase.TURN: "转牌",
+    GamePhase.RIVER: "河牌",
+    GamePhase.SHOWDOWN: "摊牌",
+    GamePhase.ENDED: "游戏结束"
+}
+
+# 按公共牌数量显示的阶段后缀(2+4模式: 2张翻牌、第3张转牌、第4张河牌)
+_COMMUNITY_PHASE_SUFFIX = ("", "", " (翻牌)", " (转牌)", " (河牌)")
+
+# 玩家位置标记
+_POSITION_MARKERS = {
+    Position.SMALL_BLIND: "(SB) ",
+    Position.BIG_BLIND: "(BB) ",
+    Position.BUTTON: "(BTN) "
+}
+
+
+def _enable_windows_vt_mode():
+    """在Windows控制台启用虚拟终端处理，使ANSI转义序列生效"""
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        # ENABLE_PROCESSED_OUTPUT | ENABLE_WRAP_AT_EOL_OUTPUT | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+    except (ImportError, AttributeError, OSError):
+        pass
 
 
 class GameInterface:
@@ -17,14 +62,103 @@ class GameInterface:
     
     def __init__(self):
         self.game: Optional[TexasHoldemGame] = None
+        self.observer = None  # 观察者GUI(可选)，等待输入期间保持其刷新
+        self._input_buffer = b""  # 已从标准输入读出、尚未取走的字节(一次可能读到多行)
+        if os.name == 'nt':
+            _enable_windows_vt_mode()
     
     def clear_screen(self):
-        """清屏"""
-        os.system('clear' if os.name == 'posix' else 'cls')
+        """清屏(直接写ANSI转义序列，避免每次重绘都启动子进程)"""
+        sys.stdout.write(_CLEAR_SCREEN)
+        sys.stdout.flush()
+    
+    def pump_observer(self):
+        """处理观察者GUI的事件(绘制、窗口管理器和输入事件)，窗口关闭后不再刷新"""
+        if self.observer is not None and not self.observer.pump():
+            self.observer = None
+    
+    def read_line(self, prompt: str) -> str:
+        """
+        读取一行输入，等待期间每50ms轮询一次并刷新观察者GUI
+        
+        没有观察者GUI时直接使用input()。
+        
+        Args:
+            prompt: 提示文字
+            
+        Returns:
+            str: 输入的一行内容(不含换行符)
+        """
+        if self.observer is None and not self._input_buffer:
+            return input(prompt)
+        
+        sys.stdout.write(prompt)
+        sys.stdout.flush()
+        
+        if os.name == 'nt':
+            return self._read_line_windows()
+        
+        try:
+            fd = sys.stdin.fileno()
+        except (OSError, ValueError, AttributeError):
+            # 标准输入不是真实文件，退回阻塞读取
+            return input()
+        
+        # 直接读文件描述符并自行分行: 经过sys.stdin的缓冲区读取时，一次粘贴的多行会
+        # 整体进入Python缓冲区，select看不到剩余的行，下一次读取就会一直等待
+        while True:
+            newline = self._input_buffer.find(b"\n")
+            if newline >= 0:
+                line = self._input_buffer[:newline]
+                self._input_buffer = self._input_buffer[newline + 1:]
+                return self._decode_input(line)
+            try:
+                readable, _, _ = select.select([fd], [], [], 0.05)
+            except (OSError, ValueError):
+                # 标准输入不支持select，退回阻塞读取
+                return input()
+            if readable:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    # 输入结束: 先交出最后不带换行符的一行
+                    if self._input_buffer:
+                        line, self._input_buffer = self._input_buffer, b""
+                        return self._decode_input(line)
+                    raise EOFError
+                self._input_buffer += chunk
+            else:
+                self.pump_observer()
+    
+    def _decode_input(self, line: bytes) -> str:
+        """按标准输入的编码解码一行原始输入"""
+        encoding = getattr(sys.stdin, "encoding", None) or "utf-8"
+        return line.decode(encoding, errors="replace").rstrip("\r")
+    
+    def _read_line_windows(self) -> str:
+        """Windows控制台下基于msvcrt.kbhit的轮询读取"""
+        import msvcrt
+        
+        chars: List[str] = []
+        while True:
+            while msvcrt.kbhit():
+                ch = msvcrt.getwche()
+                if ch in ("\r", "\n"):
+                    sys.stdout.write("\n")
+                    return "".join(chars)
+                if ch == "\x03":
+                    raise KeyboardInterrupt
+                if ch == "\b":
+                    if chars:
+                        chars.pop()
+                        sys.stdout.write(" \b")
+                else:
+                    chars.append(ch)
+            self.pump_observer()
+            time.sleep(0.05)
     
     def print_separator(self):
         """打印分隔线"""
-        print("=" * 60)
+        print(_SEPARATOR)
     
     def print_game_header(self):
         """打印游戏标题"""
@@ -37,59 +171,50 @@ class GameInterface:
         if not self.game:
             return
         
-        print(f"第 {self.game.hand_number} 手牌 | 阶段: {self._format_phase(self.game.phase)}")
-        print(f"底池: {format_chips(self.game.pot)} | 当前下注: {format_chips(self.game.current_bet)}")
+        lines = [
+            f"第 {self.game.hand_number} 手牌 | 阶段: {self._format_phase(self.game.phase)}",
+            f"底池: {format_chips(self.game.pot)} | 当前下注: {format_chips(self.game.current_bet)}",
+        ]
         
         # 显示公共牌
         if self.game.community_cards:
-            community_str = " ".join(str(card) for card in self.game.community_cards)
+            community_str = " ".join(card._display for card in self.game.community_cards)
             card_count = len(self.game.community_cards)
-            phase_name = ""
-            if card_count == 2:
-                phase_name = " (翻牌)"
-            elif card_count == 3:
-                phase_name = " (转牌)"
-            elif card_count == 4:
-                phase_name = " (河牌)"
-            print(f"公共牌: {community_str}{phase_name}")
+            phase_name = _COMMUNITY_PHASE_SUFFIX[card_count] if card_count < len(_COMMUNITY_PHASE_SUFFIX) else ""
+            lines.append(f"公共牌: {community_str}{phase_name}")
         else:
-            print("公共牌: (尚未发出)")
+            lines.append("公共牌: (尚未发出)")
         
-        print()
+        # 一次写出整块内容
+        sys.stdout.write("\n".join(lines) + "\n\n")
     
     def print_players_info(self, show_all_cards: bool = False):
         """显示所有玩家信息"""
         if not self.game:
             return
         
-        print("玩家信息:")
+        lines = ["玩家信息:"]
         for i, player in enumerate(self.game.players):
             # 标记当前行动玩家
             current_marker = "👉 " if i == self.game.current_player and not self.game.betting_round_complete else "   "
             
             # 位置标记
-            position_marker = ""
-            if player.position:
-                if player.position.value == "small_blind":
-                    position_marker = "(SB) "
-                elif player.position.value == "big_blind":
-                    position_marker = "(BB) "
-                elif player.position.value == "button":
-                    position_marker = "(BTN) "
+            position_marker = _POSITION_MARKERS.get(player.position, "")
             
             # 显示玩家基本信息
             status_info = self._get_player_status_info(player)
             # 人类玩家显示真实手牌，AI玩家显示背面或在摊牌时显示真实手牌
-            is_human = self.game.is_human_player(i) if self.game else False
+            is_human = i in self.game._human_set
             hand_display = player.get_hand_display(show_all_cards or is_human)
             
             # 当前手牌总下注 (total_bet)
             total_bet_info = f" | 总下注:{format_chips(player.total_bet):>4}" if player.total_bet > 0 else ""
             
-            print(f"{current_marker}{position_marker}{player.name:8} | 筹码:{format_chips(player.chips):>6} | "
-                  f"底牌:{hand_display} | 当前下注:{format_chips(player.current_bet):>4}{total_bet_info} {status_info}")
+            lines.append(f"{current_marker}{position_marker}{player.name:8} | 筹码:{format_chips(player.chips):>6} | "
+                         f"底牌:{hand_display} | 当前下注:{format_chips(player.current_bet):>4}{total_bet_info} {status_info}")
         
-        print()
+        # 一次写出整块内容，避免每位玩家单独print
+        sys.stdout.write("\n".join(lines) + "\n\n")
     
     def _get_player_status_info(self, player: Player) -> str:
         """获取玩家状态信息"""
@@ -104,57 +229,43 @@ class GameInterface:
     
     def _format_phase(self, phase: GamePhase) -> str:
         """格式化游戏阶段"""
-        phase_names = {
-            GamePhase.WAITING: "等待开始",
-            GamePhase.PREFLOP: "翻牌前",
-            GamePhase.FLOP: "翻牌",
-            GamePhase.TURN: "转牌", 
-            GamePhase.RIVER: "河牌",
-            GamePhase.SHOWDOWN: "摊牌",
-            GamePhase.ENDED: "游戏结束"
-        }
-        return phase_names.get(phase, str(phase.value))
+        return _PHASE_NAMES.get(phase, phase.name)
     
-    def show_available_actions(self, player: Player) -> List[PlayerAction]:
+    def show_available_actions(self, player: Player) -> Tuple[PlayerAction, ...]:
         """显示并获取可用动作"""
         if not self.game:
-            return []
+            return ()
         
-        available_actions = player.get_available_actions(self.game.current_bet, self.game.min_raise)
+        available_actions = self.game.get_player_actions(player)
         
         if not available_actions:
-            return []
+            return ()
         
-        print(f"{player.name}的回合，可用动作:")
-        
-        action_map = {}
-        for i, action in enumerate(available_actions):
-            key = str(i + 1)
-            action_map[key] = action
-            
+        lines = [f"{player.name}的回合，可用动作:"]
+        for i, action in enumerate(available_actions, 1):
             # 显示动作描述
             if action == PlayerAction.FOLD:
-                print(f"  {key}. 弃牌")
+                lines.append(f"  {i}. 弃牌")
             elif action == PlayerAction.CHECK:
-                print(f"  {key}. 过牌")
+                lines.append(f"  {i}. 过牌")
             elif action == PlayerAction.CALL:
                 call_amount = self.game.current_bet - player.current_bet
-                print(f"  {key}. 跟注 {format_chips(call_amount)}")
+                lines.append(f"  {i}. 跟注 {format_chips(call_amount)}")
             elif action == PlayerAction.RAISE:
                 min_raise_to = self.game.current_bet + self.game.min_raise
                 max_raise_to = player.chips + player.current_bet
-                print(f"  {key}. 加注 (范围: {format_chips(min_raise_to)} - {format_chips(max_raise_to)})")
+                lines.append(f"  {i}. 加注 (范围: {format_chips(min_raise_to)} - {format_chips(max_raise_to)})")
             elif action == PlayerAction.ALL_IN:
-                print(f"  {key}. 全押 {format_chips(player.chips)}")
+                lines.append(f"  {i}. 全押 {format_chips(player.chips)}")
         
-        print()
+        sys.stdout.write("\n".join(lines) + "\n\n")
         return available_actions
     
-    def get_player_input(self, available_actions: List[PlayerAction]) -> tuple[PlayerAction, int]:
+    def get_player_input(self, available_actions: Tuple[PlayerAction, ...]) -> tuple[PlayerAction, int]:
         """获取玩家输入"""
         while True:
             try:
-                choice = input("请选择动作 (输入数字): ").strip()
+                choice = self.read_line("请选择动作 (输入数字): ").strip()
                 
                 if choice == "help" or choice == "h":
                     self._show_help()
@@ -195,7 +306,7 @@ class GameInterface:
         
         while True:
             try:
-                amount_str = input(f"请输入加注金额 ({format_chips(min_raise_to)} - {format_chips(max_raise_to)}): ").strip()
+                amount_str = self.read_line(f"请输入加注金额 ({format_chips(min_raise_to)} - {format_chips(max_raise_to)}): ").strip()
                 amount = int(amount_str)
                 
                 if min_raise_to <= amount <= max_raise_to:
@@ -207,7 +318,7 @@ class GameInterface:
                 print("请输入有效的数字")
             except KeyboardInterrupt:
                 print("\\n返回动作选择")
-                return self.get_player_input(player.get_available_actions(self.game.current_bet, self.game.min_raise))
+                return self.get_player_input(self.game.get_player_actions(player))
     
     def _show_help(self):
         """显示帮助信息"""
@@ -238,7 +349,7 @@ class GameInterface:
         if not self.game:
             return
         
-        print("\\n" + "="*30 + " 手牌结果 " + "="*30)
+        print(_HAND_RESULT_HEADER)
         
         # 显示所有玩家的最终手牌
         active_players = [p for p in self.game.players if p.status != PlayerStatus.FOLDED]
@@ -250,51 +361,45 @@ class GameInterface:
         else:
             print("最终手牌:")
             
-            # 导入评估器进行牌力计算
-            try:
-                sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'Poker', 'holdem'))
-                from texas_holdem_evaluator import texas_evaluator
-                
-                player_results = []
-                for player in active_players:
-                    if len(self.game.community_cards) >= 4 and len(player.hole_cards) == 2:
-                        hand_eval = texas_evaluator.evaluate_6_cards(player.hole_cards, self.game.community_cards)
-                        score = texas_evaluator._calculate_total_score(hand_eval)
-                        player_results.append((player, hand_eval, score))
-                
-                # 按分数排序
-                player_results.sort(key=lambda x: x[2], reverse=True)
-                
-                for i, (player, hand_eval, score) in enumerate(player_results):
-                    hand_cards_str = " ".join(str(card) for card in hand_eval.cards)
-                    print(f"{i+1}. {player.name:8} | {hand_eval.hand_type} | 使用牌: {hand_cards_str}")
-                
-                # 显示获胜者
-                if player_results:
-                    best_score = player_results[0][2]
-                    winners = [result[0] for result in player_results if result[2] == best_score]
-                    
-                    if len(winners) == 1:
-                        print(f"\\n🎉 获胜者: {winners[0].name}")
-                    else:
-                        winner_names = ", ".join(w.name for w in winners)
-                        print(f"\\n🤝 平局获胜者: {winner_names}")
+            player_results = []
+            for player in active_players:
+                if len(self.game.community_cards) >= 4 and len(player.hole_cards) == 2:
+                    hand_eval = texas_evaluator.evaluate_6_cards(player.hole_cards, self.game.community_cards)
+                    score = texas_evaluator._calculate_total_score(hand_eval)
+                    player_results.append((player, hand_eval, score))
             
-            except ImportError:
-                print("无法导入手牌评估器，显示基本信息")
-                for i, player in enumerate(active_players):
-                    hand_display = player.get_hand_display(True)
-                    print(f"{i+1}. {player.name:8} | 底牌: {hand_display}")
-        
+            # 找出获胜者(单次扫描取最高分)
+            winners = []
+            if player_results:
+                best_score = max(result[2] for result in player_results)
+                winners = [result[0] for result in player_results if result[2] == best_score]
+            
+            # 按分数排序，仅用于显示
+            player_results.sort(key=lambda x: x[2], reverse=True)
+            
+            lines = []
+            for i, (player, hand_eval, score) in enumerate(player_results):
+                hand_cards_str = " ".join(card._display for card in hand_eval.cards)
+                lines.append(f"{i+1}. {player.name:8} | {hand_eval.hand_type} | 使用牌: {hand_cards_str}")
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+            
+            # 显示获胜者
+            if len(winners) == 1:
+                print(f"\\n🎉 获胜者: {winners[0].name}")
+            elif winners:
+                winner_names = ", ".join(w.name for w in winners)
+                print(f"\\n🤝 平局获胜者: {winner_names}")
+    
         print()
-        input("按回车键继续...")
+        self.read_line("按回车键继续...")
     
     def show_game_summary(self):
         """显示游戏总结"""
         if not self.game:
             return
         
-        print("\\n" + "="*25 + " 游戏结束 " + "="*25)
+        print(_GAME_SUMMARY_HEADER)
         print("最终排名:")
         
         # 按筹码排序
@@ -339,7 +444,7 @@ class GameInterface:
         """获取玩家数量"""
         while True:
             try:
-                num_players_input = input(f"请输入玩家数量 (2-8，默认4): ").strip()
+                num_players_input = self.read_line(f"请输入玩家数量 (2-8，默认4): ").strip()
                 if not num_players_input:
                     return 4
                 
@@ -364,7 +469,7 @@ class GameInterface:
         
         while True:
             try:
-                human_input = input("请输入您要操作的玩家编号 (用逗号分隔，如: 1,3,5 或直接回车默认只操作玩家1): ").strip()
+                human_input = self.read_line("请输入您要操作的玩家编号 (用逗号分隔，如: 1,3,5 或直接回车默认只操作玩家1): ").strip()
                 
                 if not human_input:
                     return [0]  # 默认只操作第一个玩家(编号0)
@@ -397,7 +502,7 @@ class GameInterface:
                 print(f"您操作的玩家: {', '.join(human_names)}")
                 print(f"AI玩家: {', '.join(ai_names)}")
                 
-                confirm = input("确认这个设置吗? (y/n，默认y): ").strip().lower()
+                confirm = self.read_line("确认这个设置吗? (y/n，默认y): ").strip().lower()
                 if confirm in ['', 'y', 'yes']:
                     return human_players
                 
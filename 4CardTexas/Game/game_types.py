@@ -3,46 +3,49 @@
 包含游戏阶段、玩家动作、玩家状态等定义
 """
 
-from enum import Enum
+from enum import IntEnum, IntFlag
 from typing import List, Optional
 
 
-class GamePhase(Enum):
+# 各枚举均使用整数取值(IntEnum/IntFlag)，比较和哈希都是整数运算；
+# 取值从1开始，保证成员在布尔上下文中始终为真
+
+class GamePhase(IntEnum):
     """游戏阶段"""
-    WAITING = "waiting"        # 等待开始
-    PREFLOP = "preflop"       # 翻牌前(发底牌)
-    FLOP = "flop"             # 翻牌(3张公共牌)
-    TURN = "turn"             # 转牌(第4张公共牌)
-    RIVER = "river"           # 河牌(第5张公共牌)
-    SHOWDOWN = "showdown"     # 摊牌
-    ENDED = "ended"           # 游戏结束
-
-
-class PlayerAction(Enum):
-    """玩家动作"""
-    FOLD = "fold"             # 弃牌
-    CHECK = "check"           # 过牌(不下注)
-    CALL = "call"             # 跟注
-    RAISE = "raise"           # 加注
-    ALL_IN = "all_in"         # 全押
+    WAITING = 1               # 等待开始
+    PREFLOP = 2               # 翻牌前(发底牌)
+    FLOP = 3                  # 翻牌(3张公共牌)
+    TURN = 4                  # 转牌(第4张公共牌)
+    RIVER = 5                 # 河牌(第5张公共牌)
+    SHOWDOWN = 6              # 摊牌
+    ENDED = 7                 # 游戏结束
+
+
+class PlayerAction(IntEnum):
+    """玩家动作(取值为2的幂，可按位组合成可用动作掩码)"""
+    FOLD = 1                  # 弃牌
+    CHECK = 2                 # 过牌(不下注)
+    CALL = 4                  # 跟注
+    RAISE = 8                 # 加注
+    ALL_IN = 16               # 全押
     
 
-class PlayerStatus(Enum):
-    """玩家状态"""
-    ACTIVE = "active"         # 活跃(还在游戏中)
-    FOLDED = "folded"         # 已弃牌
-    ALL_IN = "all_in"         # 已全押
-    OUT = "out"               # 已淘汰(筹码为0)
+class PlayerStatus(IntFlag):
+    """玩家状态(取值为2的幂，多个状态可合成掩码一次判断)"""
+    ACTIVE = 1                # 活跃(还在游戏中)
+    FOLDED = 2                # 已弃牌
+    ALL_IN = 4                # 已全押
+    OUT = 8                   # 已淘汰(筹码为0)
 
 
-class Position(Enum):
+class Position(IntEnum):
     """玩家位置"""
-    SMALL_BLIND = "small_blind"   # 小盲注
-    BIG_BLIND = "big_blind"       # 大盲注
-    EARLY = "early"               # 早期位置
-    MIDDLE = "middle"             # 中期位置
-    LATE = "late"                 # 后期位置
-    BUTTON = "button"             # 按钮位置
+    SMALL_BLIND = 1               # 小盲注
+    BIG_BLIND = 2                 # 大盲注
+    EARLY = 3                     # 早期位置
+    MIDDLE = 4                    # 中期位置
+    LATE = 5                      # 后期位置
+    BUTTON = 6                    # 按钮位置
 
 
 # 游戏配置常量
@@ -68,17 +71,19 @@ def format_chips(chips: int) -> str:
     return str(chips)
 
 
+# 动作显示格式表
+_ACTION_FORMATS = {
+    PlayerAction.FOLD: lambda amount: "弃牌",
+    PlayerAction.CHECK: lambda amount: "过牌",
+    PlayerAction.CALL: lambda amount: f"跟注 {amount}",
+    PlayerAction.RAISE: lambda amount: f"加注到 {amount}",
+    PlayerAction.ALL_IN: lambda amount: f"全押 {amount}",
+}
+
+
 def format_action(action: PlayerAction, amount: int = 0) -> str:
     """格式化动作显示"""
-    if action == PlayerAction.FOLD:
-        return "弃牌"
-    elif action == PlayerAction.CHECK:
-        return "过牌"
-    elif action == PlayerAction.CALL:
-        return f"跟注 {amount}"
-    elif action == PlayerAction.RAISE:
-        return f"加注到 {amount}"
-    elif action == PlayerAction.ALL_IN:
-        return f"全押 {amount}"
-    else:
-        return str(action.value)
\ No newline at end of file
+    formatter = _ACTION_FORMATS.get(action)
+    if formatter is None:
+        return action.name
+    return formatter(amount)
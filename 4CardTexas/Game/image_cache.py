@@ -0,0 +1,32 @@
+"""
+图片加载模块
+解码图片文件为PhotoImage；图片绑定在所属的Tk根窗口上，由使用方按窗口缓存
+(见TableObserverGUI.card_images)，窗口销毁时随之释放
+"""
+
+from tkinter import PhotoImage
+
+# Pillow为可选依赖: 安装时用它解码PNG并预先转换为RGBA，否则退回Tk自带的PhotoImage
+try:
+    from PIL import Image, ImageTk
+except ImportError:
+    Image = ImageTk = None
+
+
+def load_photo(path: str, master=None) -> PhotoImage:
+    """
+    加载图片
+
+    Args:
+        path: 图片文件路径
+        master: 图片所属的Tk根窗口
+
+    Returns:
+        PhotoImage: 加载好的图片
+    """
+    if ImageTk is None:
+        return PhotoImage(file=path, master=master)
+
+    # 解码和格式转换只在加载时做一次，绘制时直接使用转换好的图片
+    with Image.open(path) as img:
+        return ImageTk.PhotoImage(img.convert('RGBA'), master=master)
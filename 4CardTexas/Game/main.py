@@ -4,23 +4,78 @@
 """
 
 import os
+import random
+import select
 import sys
 import time
+from typing import Callable, Optional
 
-# 添加项目路径到Python路径
-current_dir = os.path.dirname(os.path.abspath(__file__))
-project_root = os.path.dirname(os.path.dirname(current_dir))
-sys.path.insert(0, project_root)
+# 直接以脚本运行时，把项目根目录加入路径，再以包的形式解析下面的相对导入
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    __package__ = "4CardTexas.Game"
 
-from game_interface import GameInterface
-from game_types import GamePhase, PlayerAction, PlayerStatus
-from observer_gui import TableObserverGUI
+from .game_interface import GameInterface
+from .game_types import GamePhase, PlayerAction, PlayerStatus, format_action, format_chips
+from .observer_gui import TableObserverGUI
+
+
+# 设置环境变量 GAME_FAST=1 可跳过所有节奏停顿(用于自动对局和基准测试)
+_FAST_MODE = os.environ.get("GAME_FAST") == "1"
+
+# AI决策专用的随机数生成器，与全局随机状态互不干扰
+_AI_RNG = random.Random()
+
+
+def set_ai_seed(seed):
+    """设置AI随机种子，用于复现对局"""
+    _AI_RNG.seed(seed)
+
+
+def _pace(delay: float, pump: Optional[Callable[[], None]] = None):
+    """
+    节奏停顿，给玩家观察时间
+    
+    基于单调时钟计算截止时间，等待期间轮询标准输入：
+    玩家提前输入时立即结束等待，Ctrl+C也能立即响应。
+    
+    Args:
+        delay: 停顿秒数
+        pump: 可选的回调，等待期间每50ms调用一次(用于刷新观察者GUI)
+    """
+    if pump is not None:
+        pump()
+    if _FAST_MODE or delay <= 0:
+        return
+    
+    poll_interval = 0.05 if pump is not None else delay
+    deadline = time.monotonic() + delay
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        timeout = min(remaining, poll_interval)
+        if os.name == 'nt':
+            # Windows下select不支持控制台句柄
+            time.sleep(timeout)
+            readable = False
+        else:
+            try:
+                readable, _, _ = select.select([sys.stdin], [], [], timeout)
+            except (OSError, ValueError):
+                time.sleep(timeout)
+                readable = False
+        if readable:
+            return  # 玩家已提前输入，留给下一次读取
+        if pump is not None:
+            pump()
 
 
 def main():
     """主游戏循环"""
     interface = GameInterface()
     gui = TableObserverGUI()  # 初始化观察者GUI
+    interface.observer = gui  # 等待玩家输入时保持GUI刷新
     
     # 显示开始菜单
     interface.start_game_menu()
@@ -64,7 +119,7 @@ def main():
             gui.update_display(build_game_state(game))  # 更新观察者GUI
             
             print(f"第 {game.hand_number} 手牌开始!")
-            time.sleep(1)
+            _pace(1, interface.pump_observer)
             
             # 翻牌前下注轮
             betting_round(interface, "翻牌前下注")
@@ -76,7 +131,7 @@ def main():
             interface.display_game()
             gui.update_display(build_game_state(game))  # 更新观察者GUI
             print("翻牌已发出! (2张公共牌)")
-            time.sleep(1)
+            _pace(1, interface.pump_observer)
             
             # 翻牌后下注轮
             betting_round(interface, "翻牌后下注")
@@ -88,7 +143,7 @@ def main():
             interface.display_game()
             gui.update_display(build_game_state(game))  # 更新观察者GUI
             print("转牌已发出! (第3张公共牌)")
-            time.sleep(1)
+            _pace(1, interface.pump_observer)
             
             # 转牌后下注轮
             betting_round(interface, "转牌后下注")
@@ -100,7 +155,7 @@ def main():
             interface.display_game()
             gui.update_display(build_game_state(game))  # 更新观察者GUI
             print("河牌已发出! (第4张公共牌)")
-            time.sleep(1)
+            _pace(1, interface.pump_observer)
             
             # 河牌后下注轮 (最终下注轮)
             betting_round(interface, "河牌后下注")
@@ -110,7 +165,10 @@ def main():
                 game.show_cards()
             
             interface.display_game()
-            gui.update_display(build_game_state(game))  # 更新观察者GUI            # 显示手牌结果
+            gui.update_display(build_game_state(game))  # 更新观察者GUI
+            gui.refresh()
+            
+            # 显示手牌结果
             interface.show_hand_result()
             
             # 移动庄家位置到下一个玩家
@@ -122,7 +180,7 @@ def main():
                 print("\\n玩家被淘汰:")
                 for player in eliminated_players:
                     print(f"  {player.name} (筹码不足)")
-                input("按回车键继续...")
+                interface.read_line("按回车键继续...")
         
         # 游戏结束
         interface.show_game_summary()
@@ -141,7 +199,7 @@ def betting_round(interface: GameInterface, round_name: str):
         return
     
     print(f"\\n--- {round_name} ---")
-    time.sleep(1)
+    _pace(1, interface.pump_observer)
     
     game.start_betting_round()
     
@@ -151,12 +209,12 @@ def betting_round(interface: GameInterface, round_name: str):
         current_player = game.players[game.current_player]
         
         # AI玩家自动决策
-        if not game.is_human_player(game.current_player):
+        if game.current_player not in game._human_set:
             action, amount = ai_player_decision(current_player, game)
             print(f"{current_player.name} 选择了: {format_action_with_amount(action, amount)}")
             
             game.process_player_action(action, amount)
-            time.sleep(1.5)  # 给玩家观察时间
+            _pace(1.5, interface.pump_observer)  # 给玩家观察时间
         else:
             # 人类玩家交互
             available_actions = interface.show_available_actions(current_player)
@@ -170,7 +228,7 @@ def betting_round(interface: GameInterface, round_name: str):
 
 def ai_player_decision(player, game) -> tuple[PlayerAction, int]:
     """AI玩家决策逻辑"""
-    available_actions = player.get_available_actions(game.current_bet, game.min_raise)
+    available_actions = game.get_player_actions(player)
     
     if not available_actions:
         return PlayerAction.FOLD, 0
@@ -180,26 +238,26 @@ def ai_player_decision(player, game) -> tuple[PlayerAction, int]:
     # 2. 如果需要跟注，根据筹码比例决定
     # 3. 随机添加一些加注行为
     
-    import random
+    action_mask = game.get_player_action_mask(player)
     
     # 计算需要跟注的金额占筹码的比例
     call_amount = game.current_bet - player.current_bet
     chip_ratio = call_amount / max(player.chips, 1) if player.chips > 0 else 1.0
     
     # 根据筹码比例和随机因素决策
-    decision_factor = random.random()
+    decision_factor = _AI_RNG.random()
     
-    if PlayerAction.CHECK in available_actions and decision_factor < 0.3:
+    if action_mask & PlayerAction.CHECK and decision_factor < 0.3:
         return PlayerAction.CHECK, 0
-    elif PlayerAction.CALL in available_actions:
+    elif action_mask & PlayerAction.CALL:
         if chip_ratio < 0.2:  # 跟注成本低
             if decision_factor < 0.7:
                 return PlayerAction.CALL, 0
-            elif PlayerAction.RAISE in available_actions and decision_factor < 0.85:
+            elif action_mask & PlayerAction.RAISE and decision_factor < 0.85:
                 # 小幅加注
                 min_raise = game.current_bet + game.min_raise
                 max_raise = player.chips + player.current_bet
-                raise_amount = min(min_raise + random.randint(0, game.min_raise), max_raise)
+                raise_amount = min(min_raise + _AI_RNG.randint(0, game.min_raise), max_raise)
                 return PlayerAction.RAISE, raise_amount
         elif chip_ratio < 0.5:  # 跟注成本中等
             if decision_factor < 0.5:
@@ -207,11 +265,11 @@ def ai_player_decision(player, game) -> tuple[PlayerAction, int]:
         # 跟注成本高，更容易弃牌
     
     # 默认行为
-    if PlayerAction.FOLD in available_actions:
+    if action_mask & PlayerAction.FOLD:
         return PlayerAction.FOLD, 0
-    elif PlayerAction.CHECK in available_actions:
+    elif action_mask & PlayerAction.CHECK:
         return PlayerAction.CHECK, 0
-    elif PlayerAction.CALL in available_actions:
+    elif action_mask & PlayerAction.CALL:
         return PlayerAction.CALL, 0
     else:
         return available_actions[0], 0
@@ -219,8 +277,6 @@ def ai_player_decision(player, game) -> tuple[PlayerAction, int]:
 
 def format_action_with_amount(action: PlayerAction, amount: int) -> str:
     """格式化动作和金额显示"""
-    from game_types import format_action, format_chips
-    
     if action == PlayerAction.RAISE and amount > 0:
         return f"{format_action(action)} 到 {format_chips(amount)}"
     elif action == PlayerAction.ALL_IN:
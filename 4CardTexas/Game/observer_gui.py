@@ -1,8 +1,26 @@
 import tkinter as tk
-from tkinter import PhotoImage
 import os
+import sys
 import math
 
+# 直接以脚本运行时，把项目根目录加入路径，再以包的形式解析下面的相对导入
+if __name__ == "__main__" and not __package__:
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    __package__ = "4CardTexas.Game"
+
+from Poker.Sheet.card import Suit, Rank
+
+from .image_cache import load_photo
+
+# 卡牌图片key表: (花色, 点数) -> "spades_A"，模块加载时生成一次
+_SUIT_KEYS = {Suit.SPADES: 'spades', Suit.HEARTS: 'hearts', Suit.DIAMONDS: 'diamonds', Suit.CLUBS: 'clubs'}
+_RANK_KEYS = {Rank.TWO: '02', Rank.THREE: '03', Rank.FOUR: '04', Rank.FIVE: '05', Rank.SIX: '06',
+              Rank.SEVEN: '07', Rank.EIGHT: '08', Rank.NINE: '09', Rank.TEN: '10', Rank.JACK: 'J',
+              Rank.QUEEN: 'Q', Rank.KING: 'K', Rank.ACE: 'A'}
+_CARD_KEYS = {(suit, rank): f"{suit_key}_{rank_key}"
+              for suit, suit_key in _SUIT_KEYS.items()
+              for rank, rank_key in _RANK_KEYS.items()}
+
 class TableObserverGUI:
     def __init__(self, root=None):
         self.root = root or tk.Tk()
@@ -17,7 +35,7 @@ class TableObserverGUI:
         self.canvas = tk.Canvas(self.root, width=800, height=600, bg='black')
         self.canvas.pack()
 
-        # 加载卡牌图片缓存
+        # 本窗口的卡牌图片缓存(图片key -> PhotoImage)，每张图片只解码一次，随窗口释放
         self.card_images = {}
         self._load_card_images()
 
@@ -29,99 +47,186 @@ class TableObserverGUI:
         self.community_positions = [(250, 150), (350, 150), (450, 150), (550, 150)]
         self.community_cards = [self.canvas.create_image(pos[0], pos[1], image=self.card_images.get('back', None)) for pos in self.community_positions]
 
-        # 玩家相关将在update_display中动态创建
+        # 各玩家人数下的座位坐标，初始化时预先算好，重绘时直接查表
+        self._seat_coords = {}
+        for n in range(2, 11):
+            self._seat_coords[n] = self._compute_seat_coords(n)
+
+        # 玩家相关画布元素按座位懒创建，之后原地更新: 座位号 -> {'text', 'c1', 'c2', 'row'}
+        self._player_items = {}
+
+        # 上一次绘制的内容，未变化的元素不再重绘
+        self._last_pot = None
+        self._last_round = None
+        self._last_community_keys = ('back',) * len(self.community_positions)
+
+        # 待绘制的最新状态，同一空闲周期内的多次更新只绘制一次
+        self._pending_state = None
+        self._redraw_scheduled = False
+
+        # 窗口被用户关闭后不再绘制
+        self.closed = False
+
+    def _compute_seat_coords(self, num_players):
+        """计算玩家围成圆形时每个座位的坐标(从顶部开始)"""
+        center_x, center_y = 400, 400
+        radius = 150
+        coords = []
+        for i in range(num_players):
+            rad_angle = math.radians((i * 360 / num_players) - 90)
+            coords.append((center_x + radius * math.cos(rad_angle), center_y + radius * math.sin(rad_angle)))
+        return coords
 
     def _load_card_images(self):
-        """加载所有卡牌图片"""
+        """加载卡背图片，其余卡牌在首次显示时再加载"""
+        self.card_images['back'] = self._load_image(os.path.join(self.card_path, "card_back.png"))
+
+    def _load_image(self, filepath):
+        """加载一张图片，文件缺失或无法解码时报告错误并返回None"""
         try:
-            self.card_images['back'] = PhotoImage(file=os.path.join(self.card_path, "card_back.png"))
-            # 加载其他卡牌 (简化版，只加载部分)
-            suits = ['spades', 'hearts', 'diamonds', 'clubs']
-            ranks = ['02','03','04','05','06','07','08','09','10','J','Q','K','A']
-            for suit in suits:
-                for rank in ranks:
-                    filename = f"card_{suit}_{rank}.png"
-                    filepath = os.path.join(self.card_path, filename)
-                    if os.path.exists(filepath):
-                        self.card_images[f"{suit}_{rank}"] = PhotoImage(file=filepath)
+            return load_photo(filepath, self.root)
         except Exception as e:
             print(f"加载图片失败: {e}")
+            return None
+
+    def _get_card_image(self, key):
+        """按需加载并缓存卡牌图片，找不到时返回卡背"""
+        if key not in self.card_images:
+            filepath = os.path.join(self.card_path, f"card_{key}.png")
+            # 缺失或加载失败的图片以None记入缓存，之后不再检查文件或重复报错
+            self.card_images[key] = self._load_image(filepath) if os.path.exists(filepath) else None
+        return self.card_images[key] or self.card_images['back']
 
     def _card_to_key(self, card):
         """将Card对象转换为图片key"""
-        if not card:
+        if card is None:
             return 'back'
-        suit_map = {'SPADES': 'spades', 'HEARTS': 'hearts', 'DIAMONDS': 'diamonds', 'CLUBS': 'clubs'}
-        rank_map = {'TWO': '02', 'THREE': '03', 'FOUR': '04', 'FIVE': '05', 'SIX': '06',
-                   'SEVEN': '07', 'EIGHT': '08', 'NINE': '09', 'TEN': '10', 'JACK': 'J',
-                   'QUEEN': 'Q', 'KING': 'K', 'ACE': 'A'}
-        suit = suit_map.get(card.suit.name, 'spades')
-        rank = rank_map.get(card.rank.name, 'A')
-        return f"{suit}_{rank}"
+        return _CARD_KEYS[(card.suit, card.rank)]
 
     def update_display(self, game_state):
-        """更新显示
+        """更新显示(在Tk空闲时统一绘制)
         game_state: 字典包含 'pot', 'round', 'community_cards', 'players'
         """
+        self._pending_state = game_state
+        if not self._redraw_scheduled and not self.closed:
+            self._redraw_scheduled = True
+            self.root.after_idle(self._flush_redraw)
+
+    def refresh(self):
+        """立即处理待绘制的更新"""
+        if self.closed:
+            return
+        try:
+            self.root.update_idletasks()
+        except tk.TclError:
+            self.closed = True
+
+    def pump(self):
+        """
+        处理一轮Tk事件(绘制、窗口管理器和输入事件)，等待终端输入期间保持窗口响应
+
+        Returns:
+            bool: 窗口仍然存在时为True，已被关闭时为False
+        """
+        if self.closed:
+            return False
+        try:
+            self.root.update()
+        except tk.TclError:
+            self.closed = True
+        return not self.closed
+
+    def _flush_redraw(self):
+        """按最新状态绘制，只更新发生变化的元素"""
+        self._redraw_scheduled = False
+        game_state = self._pending_state
+        if game_state is None:
+            return
+        self._pending_state = None
+        cimg = self.card_images  # 已加载的图片直接取用，未命中时才走加载逻辑
+
         # 更新奖池
         pot = game_state.get('pot', 0)
-        self.canvas.itemconfig(self.pot_label, text=f"奖池: {pot}")
+        if pot != self._last_pot:
+            self.canvas.itemconfig(self.pot_label, text=f"奖池: {pot}")
+            self._last_pot = pot
 
         # 更新轮次
         round_name = game_state.get('round', '翻牌前')
-        self.canvas.itemconfig(self.round_label, text=f"当前轮次: {round_name}")
+        if round_name != self._last_round:
+            self.canvas.itemconfig(self.round_label, text=f"当前轮次: {round_name}")
+            self._last_round = round_name
 
-        # 更新公共牌
+        # 更新公共牌，未发出的位置显示卡背
         community_cards = game_state.get('community_cards', [])
-        for i, card in enumerate(community_cards[:4]):
-            key = self._card_to_key(card)
-            image = self.card_images.get(key, self.card_images.get('back'))
-            self.canvas.itemconfig(self.community_cards[i], image=image)
-
-        # 隐藏多余的牌
-        for i in range(len(community_cards), 4):
-            self.canvas.itemconfig(self.community_cards[i], image=self.card_images.get('back'))
-
-        # 删除旧玩家显示
-        self.canvas.delete("player")
-
-        # 更新玩家信息 - 动态创建
+        new_keys = tuple(self._card_to_key(c) for c in community_cards[:4])
+        new_keys += ('back',) * (4 - len(new_keys))
+        if new_keys != self._last_community_keys:
+            # 只重设发生变化的位置
+            for item, key, last_key in zip(self.community_cards, new_keys, self._last_community_keys):
+                if key != last_key:
+                    self.canvas.itemconfig(item, image=cimg.get(key) or self._get_card_image(key))
+            self._last_community_keys = new_keys
+
+        # 更新玩家信息 - 每个座位的元素只创建一次，之后只更新变化的部分
         players = game_state.get('players', [])
         num_players = len(players)
         if num_players > 0:
-            center_x, center_y = 400, 400
-            radius = 150
+            seat_coords = self._seat_coords.get(num_players)
+            if seat_coords is None:
+                seat_coords = self._seat_coords[num_players] = self._compute_seat_coords(num_players)
             for i, player in enumerate(players):
-                # 计算圆形位置
-                angle = (i * 360 / num_players) - 90  # 从顶部开始
-                rad_angle = math.radians(angle)
-                x = center_x + radius * math.cos(rad_angle)
-                y = center_y + radius * math.sin(rad_angle)
+                x, y = seat_coords[i]
                 
                 # 玩家标签
                 name = player.get('name', f'玩家{i+1}')
                 chips = player.get('chips', 0)
                 status = player.get('status', '活跃')
                 text = f"{name}: 筹码 {chips} ({status})"
-                self.canvas.create_text(x, y, text=text, font=("Arial", 10), fill="white", anchor="center", tags="player")
-                
-                # 手牌位置：玩家位置下方
-                card_y = y + 40
-                card1_x = x - 25
-                card2_x = x + 25
                 
                 # 获取手牌
                 hole_cards = player.get('hole_cards', [])
                 card1_key = self._card_to_key(hole_cards[0] if len(hole_cards) > 0 else None)
                 card2_key = self._card_to_key(hole_cards[1] if len(hole_cards) > 1 else None)
                 
-                card1_img = self.card_images.get(card1_key, self.card_images.get('back'))
-                card2_img = self.card_images.get(card2_key, self.card_images.get('back'))
-                
-                self.canvas.create_image(card1_x, card_y, image=card1_img, tags="player")
-                self.canvas.create_image(card2_x, card_y, image=card2_img, tags="player")
-
-        self.root.update()
+                self._update_seat(i, x, y, text, card1_key, card2_key)
+
+        # 玩家减少时只删除多余座位的元素
+        for i in [seat for seat in self._player_items if seat >= num_players]:
+            self.canvas.delete(f"seat{i}")
+            del self._player_items[i]
+
+    def _update_seat(self, i, x, y, text, card1_key, card2_key):
+        """创建或原地更新一个座位的标签和两张手牌"""
+        # 手牌位置：玩家位置下方
+        card_y = y + 40
+        card1_x = x - 25
+        card2_x = x + 25
+        
+        cimg = self.card_images
+        items = self._player_items.get(i)
+        if items is None:
+            tags = ("player", f"seat{i}")
+            self._player_items[i] = {
+                'text': self.canvas.create_text(x, y, text=text, font=("Arial", 10), fill="white", anchor="center", tags=tags),
+                'c1': self.canvas.create_image(card1_x, card_y, image=cimg.get(card1_key) or self._get_card_image(card1_key), tags=tags),
+                'c2': self.canvas.create_image(card2_x, card_y, image=cimg.get(card2_key) or self._get_card_image(card2_key), tags=tags),
+                'row': (x, y, text, card1_key, card2_key),
+            }
+            return
+        
+        last_x, last_y, last_text, last_key1, last_key2 = items['row']
+        if (x, y) != (last_x, last_y):
+            self.canvas.coords(items['text'], x, y)
+            self.canvas.coords(items['c1'], card1_x, card_y)
+            self.canvas.coords(items['c2'], card2_x, card_y)
+        if text != last_text:
+            self.canvas.itemconfig(items['text'], text=text)
+        if card1_key != last_key1:
+            self.canvas.itemconfig(items['c1'], image=cimg.get(card1_key) or self._get_card_image(card1_key))
+        if card2_key != last_key2:
+            self.canvas.itemconfig(items['c2'], image=cimg.get(card2_key) or self._get_card_image(card2_key))
+        items['row'] = (x, y, text, card1_key, card2_key)
 
     def run(self):
         """启动GUI"""
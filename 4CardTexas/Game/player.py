@@ -3,20 +3,71 @@
 包含玩家信息、筹码管理、动作处理等
 """
 
-from typing import List, Optional
-import sys
-import os
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
-# 导入扑克牌模块
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'Poker', 'Sheet'))
-from card import Card
+from Poker.Sheet.card import Card
 
-from game_types import PlayerAction, PlayerStatus, Position, GameConfig
+from .game_types import PlayerAction, PlayerStatus, Position, GameConfig
+
+
+@lru_cache(maxsize=4096)
+def _available_actions(status: PlayerStatus, chips: int, player_bet: int,
+                       current_bet: int, min_raise: int) -> Tuple[Tuple[PlayerAction, ...], int]:
+    """
+    根据玩家状态和下注情况计算可用动作及其位掩码(结果只由参数决定，相同参数直接复用)
+    
+    Args:
+        status: 玩家状态
+        chips: 玩家剩余筹码
+        player_bet: 玩家本轮已下注金额
+        current_bet: 当前轮次最高下注
+        min_raise: 最小加注额
+        
+    Returns:
+        Tuple[Tuple[PlayerAction, ...], int]: (可用动作, 可用动作的位掩码)
+    """
+    # 不能行动的玩家没有可用动作
+    if status != PlayerStatus.ACTIVE or chips <= 0:
+        return (), 0
+    
+    actions = []
+    
+    # 总是可以弃牌(除非已经全押)
+    if status != PlayerStatus.ALL_IN:
+        actions.append(PlayerAction.FOLD)
+    
+    call_amount = current_bet - player_bet
+    
+    # 如果不需要跟注，可以过牌
+    if call_amount == 0:
+        actions.append(PlayerAction.CHECK)
+    # 如果需要跟注且有足够筹码
+    elif call_amount <= chips:
+        actions.append(PlayerAction.CALL)
+    
+    # 可以加注的条件
+    min_raise_to = current_bet + min_raise
+    if chips + player_bet >= min_raise_to:
+        actions.append(PlayerAction.RAISE)
+    
+    # 总是可以全押(如果还有筹码)
+    if chips > 0:
+        actions.append(PlayerAction.ALL_IN)
+    
+    mask = 0
+    for action in actions:
+        mask |= action
+    return tuple(actions), mask
 
 
 class Player:
     """德州扑克玩家类"""
-    
+
+    # 固定属性布局: 不为每个玩家创建__dict__，引擎热路径上的属性读写走槽位访问
+    __slots__ = ('player_id', 'name', 'chips', 'hole_cards', 'current_bet', 'total_bet',
+                 'status', 'position', 'last_action', 'is_human', '_status_counts')
+
     def __init__(self, player_id: int, name: str, chips: int = GameConfig.STARTING_CHIPS):
         """
         初始化玩家
@@ -36,12 +87,21 @@ class Player:
         self.position: Optional[Position] = None
         self.last_action: Optional[PlayerAction] = None
         self.is_human = True              # 是否为人类玩家
+        self._status_counts: Optional[dict] = None  # 所属游戏的状态计数表
+    
+    def _set_status(self, status: PlayerStatus):
+        """修改玩家状态，并同步所属游戏的状态计数"""
+        counts = self._status_counts
+        if counts is not None:
+            counts[self.status] -= 1
+            counts[status] += 1
+        self.status = status
     
     def deal_hole_cards(self, cards: List[Card]):
         """发底牌"""
         self.hole_cards = cards.copy()
     
-    def place_bet(self, amount: int) -> bool:
+    def place_bet(self, amount: int) -> int:
         """
         下注
         
@@ -49,21 +109,21 @@ class Player:
             amount: 下注金额
             
         Returns:
-            bool: 是否成功下注
+            int: 实际下注金额，筹码不足时不下注并返回0
         """
         if amount > self.chips:
-            return False
+            return 0
         
         self.chips -= amount
         self.current_bet += amount
         self.total_bet += amount
         
         if self.chips == 0:
-            self.status = PlayerStatus.ALL_IN
+            self._set_status(PlayerStatus.ALL_IN)
         
-        return True
+        return amount
     
-    def call(self, call_amount: int) -> bool:
+    def call(self, call_amount: int) -> int:
         """
         跟注
         
@@ -71,18 +131,16 @@ class Player:
             call_amount: 需要跟注的金额
             
         Returns:
-            bool: 是否成功跟注
+            int: 实际跟注金额(筹码不足时为全部筹码)
         """
-        actual_call = min(call_amount, self.chips)
-        if self.place_bet(actual_call):
-            if actual_call < call_amount:
-                self.last_action = PlayerAction.ALL_IN
-            else:
-                self.last_action = PlayerAction.CALL
-            return True
-        return False
+        actual_call = self.place_bet(min(call_amount, self.chips))
+        if actual_call < call_amount:
+            self.last_action = PlayerAction.ALL_IN
+        else:
+            self.last_action = PlayerAction.CALL
+        return actual_call
     
-    def raise_bet(self, raise_to: int) -> bool:
+    def raise_bet(self, raise_to: int) -> int:
         """
         加注到指定金额
         
@@ -90,19 +148,19 @@ class Player:
             raise_to: 加注到的总金额
             
         Returns:
-            bool: 是否成功加注
+            int: 本次实际投入的金额，加注失败时为0
         """
         raise_amount = raise_to - self.current_bet
         if raise_amount <= 0:
-            return False
+            return 0
         
-        if self.place_bet(raise_amount):
+        paid = self.place_bet(raise_amount)
+        if paid:
             if self.chips == 0:
                 self.last_action = PlayerAction.ALL_IN
             else:
                 self.last_action = PlayerAction.RAISE
-            return True
-        return False
+        return paid
     
     def check(self) -> bool:
         """过牌"""
@@ -113,14 +171,13 @@ class Player:
     
     def fold(self):
         """弃牌"""
-        self.status = PlayerStatus.FOLDED
+        self._set_status(PlayerStatus.FOLDED)
         self.last_action = PlayerAction.FOLD
     
     def all_in(self) -> int:
         """全押，返回全押金额"""
-        all_in_amount = self.chips
+        all_in_amount = self.place_bet(self.chips)
         if all_in_amount > 0:
-            self.place_bet(all_in_amount)
             self.last_action = PlayerAction.ALL_IN
         return all_in_amount
     
@@ -135,9 +192,9 @@ class Player:
         self.total_bet = 0
         self.last_action = None
         if self.chips > 0:
-            self.status = PlayerStatus.ACTIVE
+            self._set_status(PlayerStatus.ACTIVE)
         else:
-            self.status = PlayerStatus.OUT
+            self._set_status(PlayerStatus.OUT)
     
     def reset_for_new_betting_round(self):
         """为新一轮下注重置"""
@@ -155,34 +212,20 @@ class Player:
         Returns:
             List[PlayerAction]: 可用动作列表
         """
-        if not self.can_act():
-            return []
-        
-        actions = []
-        
-        # 总是可以弃牌(除非已经全押)
-        if self.status != PlayerStatus.ALL_IN:
-            actions.append(PlayerAction.FOLD)
-        
-        call_amount = current_bet - self.current_bet
-        
-        # 如果不需要跟注，可以过牌
-        if call_amount == 0:
-            actions.append(PlayerAction.CHECK)
-        # 如果需要跟注且有足够筹码
-        elif call_amount <= self.chips:
-            actions.append(PlayerAction.CALL)
-        
-        # 可以加注的条件
-        min_raise_to = current_bet + min_raise
-        if self.chips + self.current_bet >= min_raise_to:
-            actions.append(PlayerAction.RAISE)
-        
-        # 总是可以全押(如果还有筹码)
-        if self.chips > 0:
-            actions.append(PlayerAction.ALL_IN)
+        return list(self.get_action_options(current_bet, min_raise)[0])
+    
+    def get_action_options(self, current_bet: int, min_raise: int) -> Tuple[Tuple[PlayerAction, ...], int]:
+        """
+        获取玩家可用的动作及其位掩码(相同下注状态共享同一结果)
         
-        return actions
+        Args:
+            current_bet: 当前轮次最高下注
+            min_raise: 最小加注额
+            
+        Returns:
+            Tuple[Tuple[PlayerAction, ...], int]: (可用动作, 可用动作的位掩码)
+        """
+        return _available_actions(self.status, self.chips, self.current_bet, current_bet, min_raise)
     
     def __str__(self) -> str:
         """返回玩家信息字符串"""
@@ -2,21 +2,24 @@
 """
 德州扑克游戏启动脚本
 直接启动2+4德州扑克游戏
+
+推荐在项目根目录运行: python -m 4CardTexas.Game.run_game
 """
 
-import sys
+import importlib
 import os
+import sys
 
-# 添加路径
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
-
-# 直接导入并启动游戏
-from main import main
+if __package__:
+    from .main import main
+else:
+    # 直接以脚本运行时，把项目根目录加入路径，再以包的形式导入游戏模块
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+    main = importlib.import_module('4CardTexas.Game.main').main
 
 if __name__ == "__main__":
     try:
         main()
     except Exception as e:
         print(f"游戏启动失败: {e}")
-        print("请检查依赖文件是否存在")
\ No newline at end of file
+        print("请检查依赖文件是否存在")
@@ -3,21 +3,18 @@
 处理游戏逻辑、下注轮次、牌力比较等核心功能
 """
 
-from typing import List, Optional, Tuple, Dict
-import sys
-import os
+from collections import deque
+from typing import List, Optional, Tuple, Dict, Deque
 
-# 导入扑克牌模块
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'Poker', 'Sheet'))
-from card import Card
-from deck import deck_manager
+from Poker.Sheet.card import Card
+from Poker.Sheet.deck import deck_manager
+from Poker.holdem.texas_holdem_evaluator import texas_evaluator
 
-# 导入德扑评估器
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'Poker', 'holdem'))
-from texas_holdem_evaluator import texas_evaluator
+from .game_types import GamePhase, PlayerAction, PlayerStatus, Position, GameConfig
+from .player import Player
 
-from game_types import GamePhase, PlayerAction, PlayerStatus, Position, GameConfig
-from player import Player
+# 不再参与本手牌的玩家状态掩码
+_NON_PLAYING = PlayerStatus.FOLDED | PlayerStatus.OUT
 
 
 class TexasHoldemGame:
@@ -36,6 +33,7 @@ class TexasHoldemGame:
         
         self.num_players = num_players
         self.human_players = human_players or [0]  # 默认第一个玩家是人类
+        self._human_set = frozenset(self.human_players)  # 用于O(1)判断是否为人类玩家
         self.players: List[Player] = []
         self.community_cards: List[Card] = []
         self.pot = 0                     # 底池
@@ -46,6 +44,9 @@ class TexasHoldemGame:
         self.current_player = 0          # 当前行动玩家
         self.betting_round_complete = False
         self.hand_number = 0             # 手牌局数
+        self._seat_ring: Deque[int] = deque()  # 本轮行动顺序环，队首为当前行动玩家
+        # 各状态的玩家数量，随玩家状态变化增量维护
+        self._status_counts: Dict[PlayerStatus, int] = {status: 0 for status in PlayerStatus}
         
         # 初始化玩家
         self._initialize_players()
@@ -53,7 +54,7 @@ class TexasHoldemGame:
     def _initialize_players(self):
         """初始化玩家"""
         for i in range(self.num_players):
-            if i in self.human_players:
+            if i in self._human_set:
                 if len(self.human_players) == 1:
                     player_name = "你"
                 else:
@@ -62,6 +63,16 @@ class TexasHoldemGame:
                 player_name = f"AI{i+1}"
             player = Player(i, player_name, GameConfig.STARTING_CHIPS)
             self.players.append(player)
+        self._recount_statuses()
+    
+    def _recount_statuses(self):
+        """重新统计各状态玩家数量，并让玩家的状态变化同步到计数表"""
+        counts = self._status_counts
+        for status in counts:
+            counts[status] = 0
+        for player in self.players:
+            counts[player.status] += 1
+            player._status_counts = counts
     
     def start_new_hand(self):
         """开始新一手牌"""
@@ -77,7 +88,11 @@ class TexasHoldemGame:
             player.reset_for_new_hand()
         
         # 移除已淘汰的玩家
+        for player in self.players:
+            if player.status == PlayerStatus.OUT:
+                player._status_counts = None
         self.players = [p for p in self.players if p.status != PlayerStatus.OUT]
+        self._recount_statuses()
         
         if len(self.players) < 2:
             self.phase = GamePhase.ENDED
@@ -125,12 +140,12 @@ class TexasHoldemGame:
         """发底牌"""
         deck_manager.reset_deck()
         
-        # 给每个活跃玩家发2张底牌
-        for _ in range(2):
-            for player in self.players:
-                if player.status == PlayerStatus.ACTIVE:
-                    card = deck_manager.get_cards(1)[0]
-                    player.hole_cards.append(card)
+        # 给每个活跃玩家发2张底牌: 一次取出全部底牌，按逐人轮流发牌的顺序分配
+        active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
+        num_active = len(active_players)
+        cards = deck_manager.get_cards(2 * num_active)
+        for i, player in enumerate(active_players):
+            player.hole_cards = [cards[i], cards[i + num_active]]
     
     def _post_blinds(self):
         """下盲注"""
@@ -146,14 +161,12 @@ class TexasHoldemGame:
         # 下小盲注
         if small_blind_player:
             sb_amount = min(GameConfig.SMALL_BLIND, small_blind_player.chips)
-            small_blind_player.place_bet(sb_amount)
-            self.pot += sb_amount
+            self.pot += small_blind_player.place_bet(sb_amount)
         
         # 下大盲注
         if big_blind_player:
             bb_amount = min(GameConfig.BIG_BLIND, big_blind_player.chips)
-            big_blind_player.place_bet(bb_amount)
-            self.pot += bb_amount
+            self.pot += big_blind_player.place_bet(bb_amount)
             self.current_bet = bb_amount
     
     def _start_betting_round(self):
@@ -168,13 +181,20 @@ class TexasHoldemGame:
         
         # 找到第一个应该行动的玩家
         self._find_first_to_act()
+        self._build_seat_ring()
         self.betting_round_complete = False
     
+    def _build_seat_ring(self):
+        """从当前行动玩家开始，按座位顺序构建本轮可行动玩家的环"""
+        num_players = len(self.players)
+        self._seat_ring = deque(
+            seat for seat in ((self.current_player + k) % num_players for k in range(num_players))
+            if self.players[seat].can_act()
+        )
+    
     def _find_first_to_act(self):
         """找到第一个应该行动的玩家"""
-        active_players = [p for p in self.players if p.can_act()]
-        
-        if not active_players:
+        if self._status_counts[PlayerStatus.ACTIVE] == 0:
             self.betting_round_complete = True
             return
         
@@ -245,25 +265,23 @@ class TexasHoldemGame:
         elif action == PlayerAction.CALL:
             call_amount = self.current_bet - player.current_bet
             if call_amount > 0:
-                success = player.call(call_amount)
-                if success:
-                    self.pot += min(call_amount, player.chips + call_amount)
+                paid = player.call(call_amount)
+                self.pot += paid
+                success = paid > 0
             
         elif action == PlayerAction.RAISE:
             if amount > self.current_bet:
-                old_bet = player.current_bet
-                success = player.raise_bet(amount)
-                if success:
-                    bet_increase = player.current_bet - old_bet
-                    self.pot += bet_increase
-                    self.current_bet = amount
-                    self.min_raise = max(self.min_raise, amount - (self.current_bet - bet_increase))
+                paid = player.raise_bet(amount)
+                if paid:
+                    self.pot += paid
+                    self.current_bet = player.current_bet
+                    self.min_raise = max(self.min_raise, paid)
+                    success = True
             
         elif action == PlayerAction.ALL_IN:
-            old_bet = player.current_bet
-            all_in_amount = player.all_in()
-            if all_in_amount > 0:
-                self.pot += all_in_amount
+            paid = player.all_in()
+            if paid > 0:
+                self.pot += paid
                 if player.current_bet > self.current_bet:
                     self.current_bet = player.current_bet
                 success = True
@@ -276,53 +294,47 @@ class TexasHoldemGame:
     
     def _move_to_next_player(self):
         """移动到下一个玩家"""
-        start_player = self.current_player
+        ring = self._seat_ring
+        if not ring:
+            return
         
-        while True:
-            self.current_player = (self.current_player + 1) % len(self.players)
-            
-            # 如果回到起始玩家，说明一轮结束
-            if self.current_player == start_player:
-                break
-                
-            # 找到可以行动的玩家
-            if self.players[self.current_player].can_act():
-                break
+        ring.rotate(-1)
+        # 已弃牌或全押的玩家在轮到时移出环
+        while ring and not self.players[ring[0]].can_act():
+            ring.popleft()
+        
+        # 环为空说明没有可以行动的玩家，保持当前玩家不变
+        if ring:
+            self.current_player = ring[0]
     
     def _check_betting_round_complete(self):
         """检查下注轮次是否完成"""
-        active_players = [p for p in self.players if p.status == PlayerStatus.ACTIVE]
-        all_in_players = [p for p in self.players if p.status == PlayerStatus.ALL_IN]
-        non_folded_players = active_players + all_in_players
+        counts = self._status_counts
         
         # 如果只有一个或没有非弃牌玩家，直接结束手牌并进入摊牌
-        if len(non_folded_players) <= 1:
+        if counts[PlayerStatus.ACTIVE] + counts[PlayerStatus.ALL_IN] <= 1:
             self.betting_round_complete = True
             self.phase = GamePhase.SHOWDOWN  # 直接进入摊牌
             self._showdown()  # 立即分配筹码给获胜者
             return
         
-        # 检查是否所有可行动的玩家都已行动且下注相等
-        can_act_players = [p for p in active_players if p.can_act()]
-        
-        if not can_act_players:
-            # 没有可以行动的玩家，本轮结束
+        # 只剩一个或没有未全押的活跃玩家，本轮结束
+        if counts[PlayerStatus.ACTIVE] <= 1:
             self.betting_round_complete = True
             return
         
-        # 检查所有活跃玩家的下注是否相等(除了全押玩家)
-        non_all_in_active_players = [p for p in active_players if p.status != PlayerStatus.ALL_IN]
+        # 单次遍历：是否还有可行动的玩家，以及活跃玩家是否都已行动且下注相等
+        any_can_act = False
+        all_matched = True
+        for player in self.players:
+            if player.status == PlayerStatus.ACTIVE:
+                if player.chips > 0:
+                    any_can_act = True
+                if player.current_bet != self.current_bet or player.last_action is None:
+                    all_matched = False
         
-        if len(non_all_in_active_players) <= 1:
+        if not any_can_act or all_matched:
             self.betting_round_complete = True
-            return
-        
-        # 检查所有非全押的活跃玩家的下注是否相等且都已行动
-        for player in non_all_in_active_players:
-            if player.current_bet != self.current_bet or player.last_action is None:
-                return
-        
-        self.betting_round_complete = True
     
     def advance_to_next_phase(self):
         """进入下一个游戏阶段"""
@@ -345,28 +357,22 @@ class TexasHoldemGame:
     
     def _deal_flop(self):
         """发翻牌(2张公共牌) - 2+4模式"""
-        # 烧牌
-        deck_manager.get_cards(1)
-        # 发2张公共牌(不是传统的3张)
-        self.community_cards.extend(deck_manager.get_cards(2))
+        # 烧1张牌后发2张公共牌(不是传统的3张)，一次取出
+        self.community_cards.extend(deck_manager.get_cards(3)[1:])
     
     def _deal_turn(self):
         """发转牌(第3张公共牌) - 2+4模式"""
-        # 烧牌
-        deck_manager.get_cards(1)
-        # 发第3张公共牌
-        self.community_cards.extend(deck_manager.get_cards(1))
+        # 烧1张牌后发第3张公共牌
+        self.community_cards.append(deck_manager.get_cards(2)[1])
     
     def _deal_river(self):
         """发河牌(第4张公共牌) - 2+4模式"""
-        # 烧牌
-        deck_manager.get_cards(1)
-        # 发第4张公共牌(最后一张)
-        self.community_cards.extend(deck_manager.get_cards(1))
+        # 烧1张牌后发第4张公共牌(最后一张)
+        self.community_cards.append(deck_manager.get_cards(2)[1])
     
     def _showdown(self):
         """摊牌阶段"""
-        active_players = [p for p in self.players if p.status != PlayerStatus.FOLDED and p.status != PlayerStatus.OUT]
+        active_players = [p for p in self.players if not (p.status & _NON_PLAYING)]
         
         if len(active_players) == 1:
             # 只有一个玩家，直接获胜
@@ -376,29 +382,18 @@ class TexasHoldemGame:
             self.phase = GamePhase.ENDED  # 标记手牌结束
             return
         
-        # 评估所有活跃玩家的牌力
-        player_hands = []
-        for player in active_players:
-            if len(self.community_cards) >= 4 and len(player.hole_cards) == 2:
-                # 2+4模式：2张底牌 + 4张公共牌
-                hand_eval = texas_evaluator.evaluate_6_cards(player.hole_cards, self.community_cards)
-                player_hands.append((player, hand_eval))
+        # 评估所有活跃玩家的牌力(2+4模式：2张底牌 + 4张公共牌)，一次批量算出总分
+        contenders = []
+        if len(self.community_cards) >= 4:
+            contenders = [player for player in active_players if len(player.hole_cards) == 2]
+        scores = texas_evaluator.evaluate_6_cards_batch(
+            [player.hole_cards for player in contenders], self.community_cards)
         
         # 找出获胜者
-        if player_hands:
-            # 按牌力排序
-            player_hands.sort(key=lambda x: texas_evaluator._calculate_total_score(x[1]), reverse=True)
-            
-            # 分配奖池
-            winners = [player_hands[0][0]]  # 至少有一个获胜者
-            
-            # 检查是否有平局
-            best_score = texas_evaluator._calculate_total_score(player_hands[0][1])
-            for player, hand_eval in player_hands[1:]:
-                if texas_evaluator._calculate_total_score(hand_eval) == best_score:
-                    winners.append(player)
-                else:
-                    break
+        if scores:
+            # 最高分的玩家获胜(同分的玩家平局)，无需整体排序
+            best_score = max(scores)
+            winners = [player for player, score in zip(contenders, scores) if score == best_score]
             
             # 平分奖池
             pot_per_winner = self.pot // len(winners)
@@ -415,10 +410,10 @@ class TexasHoldemGame:
     
     def is_hand_complete(self) -> bool:
         """检查当前手牌是否结束"""
-        active_players = [p for p in self.players if p.status not in [PlayerStatus.FOLDED, PlayerStatus.OUT]]
+        counts = self._status_counts
         
         # 只有一个或没有活跃玩家
-        if len(active_players) <= 1:
+        if counts[PlayerStatus.ACTIVE] + counts[PlayerStatus.ALL_IN] <= 1:
             return True
         
         # 已经到摊牌阶段
@@ -439,7 +434,7 @@ class TexasHoldemGame:
     
     def get_active_players(self) -> List[Player]:
         """获取所有活跃玩家"""
-        return [p for p in self.players if p.status not in [PlayerStatus.FOLDED, PlayerStatus.OUT]]
+        return [p for p in self.players if not (p.status & _NON_PLAYING)]
     
     def advance_dealer(self):
         """移动庄家位置到下一个玩家"""
@@ -447,8 +442,7 @@ class TexasHoldemGame:
     
     def is_game_over(self) -> bool:
         """检查游戏是否结束"""
-        active_players = [p for p in self.players if p.status != PlayerStatus.OUT]
-        return len(active_players) <= 1
+        return len(self.players) - self._status_counts[PlayerStatus.OUT] <= 1
     
     def start_betting_round(self):
         """开始下注轮次(供外部调用)"""
@@ -479,7 +473,7 @@ class TexasHoldemGame:
         eliminated = []
         for player in self.players:
             if player.chips <= 0 and player.status != PlayerStatus.OUT:
-                player.status = PlayerStatus.OUT
+                player._set_status(PlayerStatus.OUT)
                 eliminated.append(player)
         return eliminated
     
@@ -487,6 +481,14 @@ class TexasHoldemGame:
         """移动到下一个玩家(供外部调用)"""
         self._move_to_next_player()
     
+    def get_player_actions(self, player: Player) -> Tuple[PlayerAction, ...]:
+        """获取玩家当前可用动作(供外部调用)"""
+        return player.get_action_options(self.current_bet, self.min_raise)[0]
+    
+    def get_player_action_mask(self, player: Player) -> int:
+        """获取玩家当前可用动作的位掩码，用于快速判断某动作是否可用"""
+        return player.get_action_options(self.current_bet, self.min_raise)[1]
+    
     def is_human_player(self, player_id: int) -> bool:
         """检查指定玩家是否为人类玩家"""
-        return player_id in self.human_players
\ No newline at end of file
+        return player_id in self._human_set
\ No newline at end of file
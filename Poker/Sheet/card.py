@@ -7,6 +7,21 @@ from enum import Enum
 from typing import Union
 
 
+# 花色符号和人头牌字母的显示表，转换字符串时直接查表
+_SUIT_SYMBOLS = {
+    "hearts": "♥",
+    "diamonds": "♦",
+    "clubs": "♣",
+    "spades": "♠"
+}
+_FACE_CARDS = {
+    11: "J",
+    12: "Q",
+    13: "K",
+    14: "A"
+}
+
+
 class Suit(Enum):
     """扑克牌花色枚举"""
     HEARTS = "hearts"      # 红桃
@@ -15,13 +30,7 @@ class Suit(Enum):
     SPADES = "spades"      # 黑桃
 
     def __str__(self):
-        suit_symbols = {
-            "hearts": "♥",
-            "diamonds": "♦", 
-            "clubs": "♣",
-            "spades": "♠"
-        }
-        return suit_symbols[self.value]
+        return _SUIT_SYMBOLS[self.value]
 
 
 class Rank(Enum):
@@ -41,18 +50,20 @@ class Rank(Enum):
     ACE = 14
 
     def __str__(self):
-        face_cards = {
-            11: "J",
-            12: "Q", 
-            13: "K",
-            14: "A"
-        }
-        return face_cards.get(self.value, str(self.value))
+        return _FACE_CARDS.get(self.value, str(self.value))
+
+
+# Cactus-Kev整数编码用表: 每个点数对应的质数，以及每种花色对应的独热位
+_RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_SUIT_BITS = {Suit.SPADES: 0x1, Suit.HEARTS: 0x2, Suit.DIAMONDS: 0x4, Suit.CLUBS: 0x8}
 
 
 class Card:
     """扑克牌类"""
     
+    # 固定属性布局，不为每张牌创建__dict__
+    __slots__ = ('suit', 'rank', 'value', 'suit_id', 'key', '_display')
+    
     def __init__(self, suit: Suit, rank: Rank):
         """
         初始化扑克牌
@@ -63,10 +74,17 @@ class Card:
         """
         self.suit = suit
         self.rank = rank
+        self.value = rank.value          # 点数值，避免每次经过枚举取值
+        self.suit_id = _SUIT_BITS[suit]  # 花色整数编号(独热位)
+        self._display = f"{rank}{suit}"  # 显示字符串，构造时生成一次
+        
+        # Cactus-Kev 32位编码: 点数位(16-28) | 花色位(12-15) | 点数序号(8-11) | 点数质数(0-7)
+        rank_idx = self.value - 2
+        self.key = (1 << (16 + rank_idx)) | (_SUIT_BITS[suit] << 12) | (rank_idx << 8) | _RANK_PRIMES[rank_idx]
     
     def __str__(self) -> str:
         """返回扑克牌的字符串表示"""
-        return f"{self.rank}{self.suit}"
+        return self._display
     
     def __repr__(self) -> str:
         """返回扑克牌的调试字符串表示"""
@@ -86,15 +104,15 @@ class Card:
         """比较牌的大小，先比较点数，再比较花色"""
         if not isinstance(other, Card):
             return NotImplemented
-        if self.rank.value != other.rank.value:
-            return self.rank.value < other.rank.value
+        if self.value != other.value:
+            return self.value < other.value
         # 花色顺序：梅花 < 方块 < 红桃 < 黑桃
         suit_order = {Suit.CLUBS: 1, Suit.DIAMONDS: 2, Suit.HEARTS: 3, Suit.SPADES: 4}
         return suit_order[self.suit] < suit_order[other.suit]
     
     def get_value(self) -> int:
         """获取牌的点数值"""
-        return self.rank.value
+        return self.value
     
     def is_red(self) -> bool:
         """判断是否为红色牌(红桃或方块)"""
@@ -4,8 +4,16 @@
 """
 
 import random
+from array import array
 from typing import List, Optional
-from card import Card, Suit, Rank
+from .card import Card, Suit, Rank
+
+
+# 完整52张牌的模板，模块加载时创建一次；牌是不可变的值对象，各牌组可共享引用
+_FULL_DECK = tuple(Card(suit, rank) for suit in Suit for rank in Rank)
+# 牌在模板中的序号，牌组内部只保存序号(每张牌1字节)
+_CARD_INDEX = {card: i for i, card in enumerate(_FULL_DECK)}
+_FULL_INDICES = array('B', range(len(_FULL_DECK)))
 
 
 class Deck:
@@ -18,26 +26,21 @@ class Deck:
         Args:
             shuffle: 是否在初始化时洗牌
         """
-        self._cards: List[Card] = []
+        self._cards = array('B')  # 牌在_FULL_DECK中的序号，末尾为牌顶
         self._create_deck()
         if shuffle:
             self.shuffle()
     
     def _create_deck(self):
         """创建一副完整的52张牌(不含joker)"""
-        self._cards = []
-        for suit in Suit:
-            for rank in Rank:
-                self._cards.append(Card(suit, rank))
+        self._cards = array('B', _FULL_INDICES)
     
     def shuffle(self):
         """
-        使用Fisher-Yates洗牌算法洗牌
-        这是一个高效且公平的洗牌算法
+        洗牌
+        对剩余的牌做一次等概率的随机排列，由random.sample一次完成，不逐张交换
         """
-        for i in range(len(self._cards) - 1, 0, -1):
-            j = random.randint(0, i)
-            self._cards[i], self._cards[j] = self._cards[j], self._cards[i]
+        self._cards[:] = array('B', random.sample(self._cards, len(self._cards)))
     
     def deal_card(self) -> Optional[Card]:
         """
@@ -48,7 +51,7 @@ class Deck:
         """
         if self.is_empty():
             return None
-        return self._cards.pop()
+        return _FULL_DECK[self._cards.pop()]
     
     def deal_cards(self, count: int) -> List[Card]:
         """
@@ -66,13 +69,13 @@ class Deck:
         if count > len(self._cards):
             raise ValueError(f"要发的牌数({count})超过剩余牌数({len(self._cards)})")
         
-        dealt_cards = []
-        for _ in range(count):
-            card = self.deal_card()
-            if card is not None:
-                dealt_cards.append(card)
+        if count <= 0:
+            return []
         
-        return dealt_cards
+        # 一次切出牌顶的count张，倒序后与逐张从牌顶发出的顺序相同
+        dealt = self._cards[-count:]
+        del self._cards[-count:]
+        return [_FULL_DECK[i] for i in reversed(dealt)]
     
     def peek_top_card(self) -> Optional[Card]:
         """
@@ -83,7 +86,7 @@ class Deck:
         """
         if self.is_empty():
             return None
-        return self._cards[-1]
+        return _FULL_DECK[self._cards[-1]]
     
     def reset(self, shuffle: bool = False):
         """
@@ -92,7 +95,8 @@ class Deck:
         Args:
             shuffle: 是否在重置后洗牌
         """
-        self._create_deck()
+        # 直接用模板覆盖现有列表，不重新创建牌对象
+        self._cards[:] = _FULL_INDICES
         if shuffle:
             self.shuffle()
     
@@ -103,7 +107,7 @@ class Deck:
         Args:
             card: 要加入的牌
         """
-        self._cards.insert(0, card)
+        self._cards.insert(0, _CARD_INDEX[card])
     
     def add_cards(self, cards: List[Card]):
         """
@@ -112,8 +116,8 @@ class Deck:
         Args:
             cards: 要加入的牌列表
         """
-        for card in cards:
-            self.add_card(card)
+        # 与逐张加入底部的结果相同(最后一张在最底部)，但只整体移动一次
+        self._cards[:0] = array('B', [_CARD_INDEX[card] for card in reversed(cards)])
     
     def is_empty(self) -> bool:
         """检查牌组是否为空"""
@@ -130,7 +134,7 @@ class Deck:
         Returns:
             List[Card]: 牌组中所有牌的副本
         """
-        return self._cards.copy()
+        return [_FULL_DECK[i] for i in self._cards]
     
     def __len__(self) -> int:
         """返回牌组中的牌数"""
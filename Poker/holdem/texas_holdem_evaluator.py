@@ -4,15 +4,16 @@
 """
 
 from enum import Enum
-from typing import List, Tuple, Optional
-from itertools import combinations
+from typing import List, Sequence, Tuple, Optional
 from collections import Counter
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
 
-# 导入扑克牌模块
-import sys
-import os
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(__file__)), 'Sheet'))
-from card import Card, Suit, Rank
+from ..Sheet.card import Card, Suit, Rank
+
+
+# 6张牌评估结果的缓存容量(按牌的集合缓存，与发牌顺序无关)
+_EVALUATION_CACHE_SIZE = 1 << 16
 
 
 class HandType(Enum):
@@ -39,7 +40,11 @@ class HandType(Enum):
 class HandEvaluation:
     """牌力评估结果"""
     
-    def __init__(self, hand_type: HandType, cards: List[Card], score: int, kickers: Optional[List[int]] = None):
+    # 固定属性布局，不为每个评估结果创建__dict__
+    __slots__ = ('hand_type', 'cards', 'score', 'kickers', 'hand_rank', 'sort_key')
+    
+    def __init__(self, hand_type: HandType, cards: Sequence[Card], score: int,
+                 kickers: Optional[Sequence[int]] = None, hand_rank: int = 0):
         """
         初始化牌力评估结果
         
@@ -47,12 +52,17 @@ class HandEvaluation:
             hand_type: 牌型
             cards: 组成这个牌型的5张牌
             score: 牌型基础分数
-            kickers: 踢脚牌点数列表，用于同牌型比较
+            kickers: 踢脚牌点数，用于同牌型比较
+            hand_rank: 牌力名次(1为皇家同花顺，7462为最小的高牌)，0表示未查表
         """
+        # 评估结果会被缓存并在多次调用间共享，牌和踢脚牌都存为不可变的元组
         self.hand_type = hand_type
-        self.cards = cards
+        self.cards: Tuple[Card, ...] = tuple(cards)
         self.score = score
-        self.kickers = kickers or []
+        self.kickers: Tuple[int, ...] = tuple(kickers) if kickers else ()
+        self.hand_rank = hand_rank
+        # 比较用的键: 按(牌型, 牌型分数, 踢脚牌)逐项比较，越大牌力越强
+        self.sort_key = (hand_type.value, score, self.kickers)
     
     def __str__(self):
         return f"{self.hand_type}({[str(card) for card in self.cards]})"
@@ -66,7 +76,73 @@ class TexasHoldemEvaluator:
     
     def __init__(self):
         """初始化评估器"""
-        pass
+        # 5张牌查找表，第一次评估时生成
+        self._flush_lookup: Optional[list] = None
+        self._unsuited_lookup: Optional[dict] = None
+        
+        # 按编码索引的52张牌，用于从缓存键还原出牌
+        self._cards_by_key = {card.key: card for card in (Card(suit, rank) for suit in Suit for rank in Rank)}
+        # 同一组牌(不论顺序)只评估一次
+        self._evaluate_key = lru_cache(maxsize=_EVALUATION_CACHE_SIZE)(self._evaluate_key)
+    
+    def _build_lookup_tables(self) -> Tuple[list, dict]:
+        """
+        枚举全部7462种不同的5张牌牌力，生成两张查找表
+        
+        同花表是以13位点数位图(5张牌点数位按位或)为下标的定长列表，直接按下标取值；
+        非同花表以5个点数质数之积为键(质数分解唯一，不同点数组合不会冲突)。
+        表项为(名次, 牌型, 牌型分数, 踢脚牌)，名次按牌力从强到弱为1..7462。
+        
+        Returns:
+            Tuple[list, dict]: (同花查找表, 非同花查找表)
+        """
+        ranks = list(Rank)
+        suits = list(Suit)
+        deck = {(suit, rank): Card(suit, rank) for suit in suits for rank in ranks}
+        entries = []
+        
+        # 5张同花色的牌: 同花顺/皇家同花顺/同花
+        for combo in combinations(ranks, 5):
+            cards = [deck[suits[0], rank] for rank in combo]
+            entries.append((True, cards))
+        
+        # 非同花: 每个点数最多4张，同点数的牌依次分配不同花色，5张不同点数时换掉一张的花色避免成为同花
+        for combo in combinations_with_replacement(ranks, 5):
+            if combo[0] == combo[4]:
+                continue
+            seen = Counter()
+            cards = []
+            for rank in combo:
+                cards.append(deck[suits[seen[rank]], rank])
+                seen[rank] += 1
+            if len(seen) == 5:
+                cards[-1] = deck[suits[1], combo[-1]]
+            entries.append((False, cards))
+        
+        evaluations = []
+        for is_flush, cards in entries:
+            sorted_cards = sorted(cards, key=lambda x: x.value, reverse=True)
+            evaluations.append((is_flush, cards, self._classify_5_cards(sorted_cards)))
+        
+        # 按(牌型, 牌型分数, 踢脚牌)从强到弱排序得到名次
+        evaluations.sort(key=lambda item: item[2].sort_key, reverse=True)
+        
+        flush_lookup = [None] * (1 << 13)
+        unsuited_lookup = {}
+        for hand_rank, (is_flush, cards, evaluation) in enumerate(evaluations, 1):
+            entry = (hand_rank, evaluation.hand_type, evaluation.score, evaluation.kickers)
+            if is_flush:
+                rank_bits = 0
+                for card in cards:
+                    rank_bits |= card.key
+                flush_lookup[rank_bits >> 16] = entry
+            else:
+                prime_product = 1
+                for card in cards:
+                    prime_product *= card.key & 0xFF
+                unsuited_lookup[prime_product] = entry
+        
+        return flush_lookup, unsuited_lookup
     
     def evaluate_6_cards(self, hole_cards: List[Card], community_cards: List[Card]) -> HandEvaluation:
         """
@@ -87,28 +163,165 @@ class TexasHoldemEvaluator:
         if len(community_cards) != 4:
             raise ValueError("公共牌必须是4张")
         
-        all_cards = hole_cards + community_cards
+        return self._evaluate_key(tuple(sorted([card.key for card in hole_cards + community_cards])))
+    
+    def evaluate_6_cards_batch(self, hole_cards_list: List[List[Card]], community_cards: List[Card]) -> List[int]:
+        """
+        在同一组公共牌下批量评估多位玩家的牌力，只返回总分数
         
-        # 从6张牌中选择5张牌的所有组合
-        best_evaluation: Optional[HandEvaluation] = None
-        best_score = -1
+        适合摊牌比大小或模拟时大量计算牌力。
         
-        for five_cards in combinations(all_cards, 5):
-            evaluation = self._evaluate_5_cards(list(five_cards))
-            total_score = self._calculate_total_score(evaluation)
+        Args:
+            hole_cards_list: 每位玩家的2张底牌
+            community_cards: 共用的4张公共牌
             
-            if total_score > best_score:
-                best_score = total_score
-                best_evaluation = evaluation
+        Returns:
+            List[int]: 每位玩家的总分数(同_calculate_total_score)，分数越大牌力越强
+            
+        Raises:
+            ValueError: 如果某手牌的牌数不正确
+        """
+        evaluate = self.evaluate_6_cards
+        total_score = self._calculate_total_score
+        return [total_score(evaluate(hole_cards, community_cards)) for hole_cards in hole_cards_list]
+    
+    def _evaluate_key(self, cache_key: Tuple[int, ...]) -> HandEvaluation:
+        """
+        评估一组牌(由排好序的牌编码组成的缓存键表示)，结果按键缓存
+        
+        Args:
+            cache_key: 各牌编码从小到大排列的元组
+            
+        Returns:
+            HandEvaluation: 最佳牌力评估结果
+        """
+        cards = [self._cards_by_key[key] for key in cache_key]
+        return self._evaluate_5_cards(self._best_5_cards(cards))
+    
+    def _best_5_cards(self, cards: List[Card]) -> List[Card]:
+        """
+        直接从5张及以上的牌中挑出最佳的5张牌
+        
+        点数计数、花色计数、各花色的点数位图和排序都只做一次，按牌型从高到低
+        直接挑牌，不再逐个枚举5张牌的组合。点数相同的牌优先选用排序中靠前的一张。
+        
+        Args:
+            cards: 参与评估的牌(至少5张)
+            
+        Returns:
+            List[Card]: 最佳的5张牌(按点数从大到小)
+        """
+        sorted_cards = sorted(cards, key=lambda x: x.value, reverse=True)
+        rank_counts = Counter(card.value for card in sorted_cards)
+        suit_counts = Counter(card.suit_id for card in sorted_cards)
+        
+        # 每种花色的点数位图，全部牌的位图由其合并得到，顺子判断不再重新扫描牌
+        suit_rank_bits = dict.fromkeys(suit_counts, 0)
+        for card in sorted_cards:
+            suit_rank_bits[card.suit_id] |= card.key
+        rank_bits = 0
+        for bits in suit_rank_bits.values():
+            rank_bits |= bits
+        
+        # 同花顺/皇家同花顺
+        flush_cards = None
+        for suit_id, count in suit_counts.items():
+            if count >= 5:
+                flush_cards = [card for card in sorted_cards if card.suit_id == suit_id]
+                high_rank = self._straight_high(suit_rank_bits[suit_id])
+                if high_rank:
+                    return self._pick_straight(flush_cards, high_rank)
+                break
+        
+        # 按(张数, 点数)从大到小排列各点数
+        groups = sorted(rank_counts.items(), key=lambda item: (item[1], item[0]), reverse=True)
+        top_rank, top_count = groups[0]
+        
+        # 四条
+        if top_count == 4:
+            kicker = max(rank for rank in rank_counts if rank != top_rank)
+            return self._take_cards(sorted_cards, {top_rank: 4, kicker: 1})
+        
+        # 葫芦(另一组三条也可以拆成对子)
+        if top_count == 3:
+            pair_ranks = [rank for rank, count in groups[1:] if count >= 2]
+            if pair_ranks:
+                return self._take_cards(sorted_cards, {top_rank: 3, max(pair_ranks): 2})
+        
+        # 同花
+        if flush_cards is not None:
+            return flush_cards[:5]
+        
+        # 顺子
+        high_rank = self._straight_high(rank_bits)
+        if high_rank:
+            return self._pick_straight(sorted_cards, high_rank)
+        
+        # 三条
+        if top_count == 3:
+            kickers = sorted((rank for rank in rank_counts if rank != top_rank), reverse=True)[:2]
+            return self._take_cards(sorted_cards, {top_rank: 3, kickers[0]: 1, kickers[1]: 1})
+        
+        pairs = [rank for rank, count in groups if count == 2]
+        
+        # 两对(有三对时取最大的两对，第三对可作踢脚)
+        if len(pairs) >= 2:
+            high_pair, low_pair = pairs[0], pairs[1]
+            kicker = max(rank for rank in rank_counts if rank != high_pair and rank != low_pair)
+            return self._take_cards(sorted_cards, {high_pair: 2, low_pair: 2, kicker: 1})
+        
+        # 对子
+        if pairs:
+            pair_rank = pairs[0]
+            kickers = sorted((rank for rank in rank_counts if rank != pair_rank), reverse=True)[:3]
+            need = {pair_rank: 2}
+            for kicker in kickers:
+                need[kicker] = 1
+            return self._take_cards(sorted_cards, need)
+        
+        # 高牌
+        return sorted_cards[:5]
+    
+    def _take_cards(self, sorted_cards: List[Card], need: dict) -> List[Card]:
+        """按点数需要的张数从已排序的牌中依次取牌，保持原有顺序"""
+        need = dict(need)
+        chosen = []
+        for card in sorted_cards:
+            rank = card.value
+            if need.get(rank, 0) > 0:
+                need[rank] -= 1
+                chosen.append(card)
+        return chosen
+    
+    def _rank_bits(self, cards: List[Card]) -> int:
+        """合并牌的编码，点数位(16-28)即牌中出现过的点数"""
+        rank_bits = 0
+        for card in cards:
+            rank_bits |= card.key
+        return rank_bits
+    
+    def _straight_high(self, rank_bits: int) -> int:
+        """根据合并后的牌编码返回能组成的最大顺子的最高点数，没有顺子时返回0"""
+        rank_bits >>= 16
         
-        if best_evaluation is None:
-            raise ValueError("无法评估牌力")
+        # 左移一位后把A复制到最低位当作1点，A-2-3-4-5也成为普通的5个连续位
+        bits = (rank_bits << 1) | (rank_bits >> 12)
         
-        return best_evaluation
+        # 连续5位同时为1的位置即顺子的最低点，最高的一个对应最大的顺子
+        runs = bits & (bits >> 1) & (bits >> 2) & (bits >> 3) & (bits >> 4)
+        return runs.bit_length() + 4 if runs else 0
+    
+    def _pick_straight(self, sorted_cards: List[Card], high_rank: int) -> List[Card]:
+        """从已排序的牌中取出以high_rank为最高点数的顺子"""
+        if high_rank == 5:
+            ranks = (14, 5, 4, 3, 2)
+        else:
+            ranks = range(high_rank, high_rank - 5, -1)
+        return self._take_cards(sorted_cards, {rank: 1 for rank in ranks})
     
     def _evaluate_5_cards(self, cards: List[Card]) -> HandEvaluation:
         """
-        评估5张牌的牌力
+        评估5张牌的牌力(查表)
         
         Args:
             cards: 5张牌
@@ -119,25 +332,52 @@ class TexasHoldemEvaluator:
         if len(cards) != 5:
             raise ValueError("必须是5张牌")
         
-        # 按点数排序
-        sorted_cards = sorted(cards, key=lambda x: x.rank.value, reverse=True)
+        hand_rank, hand_type, score, kickers = self._lookup_5_cards(cards)
         
-        # 检查各种牌型
-        if self._is_royal_flush(sorted_cards):
-            return HandEvaluation(HandType.ROYAL_FLUSH, sorted_cards, 10000)
+        # 按点数排序
+        sorted_cards = sorted(cards, key=lambda x: x.value, reverse=True)
+        return HandEvaluation(hand_type, sorted_cards, score, kickers, hand_rank)
+    
+    def _lookup_5_cards(self, cards: List[Card]) -> tuple:
+        """查表得到5张牌的(名次, 牌型, 牌型分数, 踢脚牌)"""
+        if self._flush_lookup is None:
+            self._flush_lookup, self._unsuited_lookup = self._build_lookup_tables()
+        
+        k0, k1, k2, k3, k4 = (card.key for card in cards)
+        if k0 & k1 & k2 & k3 & k4 & 0xF000:
+            return self._flush_lookup[(k0 | k1 | k2 | k3 | k4) >> 16]
+        return self._unsuited_lookup[(k0 & 0xFF) * (k1 & 0xFF) * (k2 & 0xFF) * (k3 & 0xFF) * (k4 & 0xFF)]
+    
+    def _classify_5_cards(self, sorted_cards: List[Card]) -> HandEvaluation:
+        """
+        逐个牌型检查5张牌的牌力(用于生成查找表)
         
+        Args:
+            sorted_cards: 按点数从大到小排好序的5张牌
+            
+        Returns:
+            HandEvaluation: 牌力评估结果
+        """
+        # 点数计数只做一次，按各点数张数的组合直接分派到对应牌型
+        rank_counts = Counter(card.value for card in sorted_cards)
+        pattern = tuple(sorted(rank_counts.values(), reverse=True))
+        
+        if pattern == (4, 1):
+            return self._check_four_of_a_kind(sorted_cards, rank_counts)
+        if pattern == (3, 2):
+            return self._check_full_house(sorted_cards, rank_counts)
+        if pattern == (3, 1, 1):
+            return self._check_three_of_a_kind(sorted_cards, rank_counts)
+        if pattern == (2, 2, 1):
+            return self._check_two_pair(sorted_cards, rank_counts)
+        if pattern == (2, 1, 1, 1):
+            return self._check_pair(sorted_cards, rank_counts)
+        
+        # 5张点数各不相同: 只可能是(皇家)同花顺、同花、顺子或高牌
         straight_flush_result = self._check_straight_flush(sorted_cards)
         if straight_flush_result:
             return straight_flush_result
         
-        four_kind_result = self._check_four_of_a_kind(sorted_cards)
-        if four_kind_result:
-            return four_kind_result
-        
-        full_house_result = self._check_full_house(sorted_cards)
-        if full_house_result:
-            return full_house_result
-        
         flush_result = self._check_flush(sorted_cards)
         if flush_result:
             return flush_result
@@ -146,46 +386,24 @@ class TexasHoldemEvaluator:
         if straight_result:
             return straight_result
         
-        three_kind_result = self._check_three_of_a_kind(sorted_cards)
-        if three_kind_result:
-            return three_kind_result
-        
-        two_pair_result = self._check_two_pair(sorted_cards)
-        if two_pair_result:
-            return two_pair_result
-        
-        pair_result = self._check_pair(sorted_cards)
-        if pair_result:
-            return pair_result
-        
         # 高牌
         return self._check_high_card(sorted_cards)
     
-    def _is_royal_flush(self, cards: List[Card]) -> bool:
-        """检查是否为皇家同花顺"""
-        if not self._is_flush(cards):
-            return False
-        
-        ranks = [card.rank.value for card in cards]
-        royal_ranks = [14, 13, 12, 11, 10]  # A, K, Q, J, 10
-        return sorted(ranks, reverse=True) == royal_ranks
-    
     def _check_straight_flush(self, cards: List[Card]) -> Optional[HandEvaluation]:
-        """检查同花顺"""
-        if self._is_flush(cards) and self._is_straight_values([card.rank.value for card in cards]):
-            high_card = max(cards, key=lambda x: x.rank.value)
-            # 特殊处理A-2-3-4-5的情况
-            ranks = [card.rank.value for card in cards]
-            if sorted(ranks) == [2, 3, 4, 5, 14]:  # A-2-3-4-5
-                score = 500 + 5  # 5为最高牌
-            else:
-                score = 500 + high_card.rank.value
-            return HandEvaluation(HandType.STRAIGHT_FLUSH, cards, score, [high_card.rank.value])
+        """检查同花顺(A为最高牌时即皇家同花顺)"""
+        if not self._is_flush(cards):
+            return None
+        high_rank = self._straight_high(self._rank_bits(cards))  # A-2-3-4-5时为5
+        if high_rank == 14:
+            return HandEvaluation(HandType.ROYAL_FLUSH, cards, 10000)
+        if high_rank:
+            high_card = max(cards, key=lambda x: x.value)
+            score = 500 + high_rank
+            return HandEvaluation(HandType.STRAIGHT_FLUSH, cards, score, [high_card.value])
         return None
     
-    def _check_four_of_a_kind(self, cards: List[Card]) -> Optional[HandEvaluation]:
+    def _check_four_of_a_kind(self, cards: List[Card], rank_counts: Counter) -> Optional[HandEvaluation]:
         """检查四条"""
-        rank_counts = Counter(card.rank.value for card in cards)
         for rank, count in rank_counts.items():
             if count == 4:
                 kicker = [r for r in rank_counts.keys() if r != rank][0]
@@ -193,9 +411,8 @@ class TexasHoldemEvaluator:
                 return HandEvaluation(HandType.FOUR_KIND, cards, score, [rank, kicker])
         return None
     
-    def _check_full_house(self, cards: List[Card]) -> Optional[HandEvaluation]:
+    def _check_full_house(self, cards: List[Card], rank_counts: Counter) -> Optional[HandEvaluation]:
         """检查葫芦"""
-        rank_counts = Counter(card.rank.value for card in cards)
         three_rank = None
         pair_rank = None
         
@@ -213,28 +430,21 @@ class TexasHoldemEvaluator:
     def _check_flush(self, cards: List[Card]) -> Optional[HandEvaluation]:
         """检查同花"""
         if self._is_flush(cards):
-            kickers = sorted([card.rank.value for card in cards], reverse=True)
+            kickers = sorted([card.value for card in cards], reverse=True)
             score = 200 + kickers[0]
             return HandEvaluation(HandType.FLUSH, cards, score, kickers)
         return None
     
     def _check_straight(self, cards: List[Card]) -> Optional[HandEvaluation]:
         """检查顺子"""
-        ranks = [card.rank.value for card in cards]
-        if self._is_straight_values(ranks):
-            # 特殊处理A-2-3-4-5的情况
-            if sorted(ranks) == [2, 3, 4, 5, 14]:
-                score = 100 + 5  # 5为最高牌
-                high_rank = 5
-            else:
-                high_rank = max(ranks)
-                score = 100 + high_rank
+        high_rank = self._straight_high(self._rank_bits(cards))  # A-2-3-4-5时为5
+        if high_rank:
+            score = 100 + high_rank
             return HandEvaluation(HandType.STRAIGHT, cards, score, [high_rank])
         return None
     
-    def _check_three_of_a_kind(self, cards: List[Card]) -> Optional[HandEvaluation]:
+    def _check_three_of_a_kind(self, cards: List[Card], rank_counts: Counter) -> Optional[HandEvaluation]:
         """检查三条"""
-        rank_counts = Counter(card.rank.value for card in cards)
         for rank, count in rank_counts.items():
             if count == 3:
                 kickers = sorted([r for r in rank_counts.keys() if r != rank], reverse=True)
@@ -242,9 +452,8 @@ class TexasHoldemEvaluator:
                 return HandEvaluation(HandType.THREE_KIND, cards, score, [rank] + kickers)
         return None
     
-    def _check_two_pair(self, cards: List[Card]) -> Optional[HandEvaluation]:
+    def _check_two_pair(self, cards: List[Card], rank_counts: Counter) -> Optional[HandEvaluation]:
         """检查两对"""
-        rank_counts = Counter(card.rank.value for card in cards)
         pairs = [rank for rank, count in rank_counts.items() if count == 2]
         
         if len(pairs) == 2:
@@ -254,9 +463,8 @@ class TexasHoldemEvaluator:
             return HandEvaluation(HandType.TWO_PAIR, cards, score, pairs + [kicker])
         return None
     
-    def _check_pair(self, cards: List[Card]) -> Optional[HandEvaluation]:
+    def _check_pair(self, cards: List[Card], rank_counts: Counter) -> Optional[HandEvaluation]:
         """检查对子"""
-        rank_counts = Counter(card.rank.value for card in cards)
         for rank, count in rank_counts.items():
             if count == 2:
                 kickers = sorted([r for r in rank_counts.keys() if r != rank], reverse=True)
@@ -266,32 +474,14 @@ class TexasHoldemEvaluator:
     
     def _check_high_card(self, cards: List[Card]) -> HandEvaluation:
         """高牌"""
-        kickers = sorted([card.rank.value for card in cards], reverse=True)
+        kickers = sorted([card.value for card in cards], reverse=True)
         score = 60 + kickers[0]
         return HandEvaluation(HandType.HIGH_CARD, cards, score, kickers)
     
     def _is_flush(self, cards: List[Card]) -> bool:
-        """检查是否为同花"""
-        suits = [card.suit for card in cards]
-        return len(set(suits)) == 1
-    
-    def _is_straight_values(self, ranks: List[int]) -> bool:
-        """检查数值是否构成顺子"""
-        sorted_ranks = sorted(set(ranks))
-        
-        # 检查正常顺子
-        if len(sorted_ranks) == 5:
-            for i in range(1, len(sorted_ranks)):
-                if sorted_ranks[i] != sorted_ranks[i-1] + 1:
-                    break
-            else:
-                return True
-        
-        # 检查A-2-3-4-5的特殊情况
-        if sorted_ranks == [2, 3, 4, 5, 14]:
-            return True
-        
-        return False
+        """检查5张牌是否为同花(各牌编码的花色位按位与后仍非零)"""
+        c0, c1, c2, c3, c4 = cards
+        return bool(c0.key & c1.key & c2.key & c3.key & c4.key & 0xF000)
     
     def _calculate_total_score(self, evaluation: HandEvaluation) -> int:
         """
@@ -301,24 +491,15 @@ class TexasHoldemEvaluator:
             evaluation: 牌力评估结果
             
         Returns:
-            int: 总分数
+            int: 总分数(名次取负，分数越大牌力越强)
+            
+        Raises:
+            ValueError: 如果评估结果没有经过查表(名次为0)
         """
-        # 牌型基础分数(乘以大数确保牌型优先级)
-        base_score = evaluation.hand_type.value * 1000000
-        
-        # 牌型内部分数
-        type_score = evaluation.score * 1000
-        
-        # 添加踢脚牌分数(权重较小)
-        kicker_score = 0
-        for i, kicker in enumerate(evaluation.kickers):
-            # 使用更小的权重，每个踢脚牌最多贡献15分
-            kicker_score += kicker * (16 ** (len(evaluation.kickers) - i - 1))
-        
-        # 确保踢脚牌分数不会超过100000
-        kicker_score = min(kicker_score, 99999)
-        
-        return base_score + type_score + kicker_score
+        # 名次为0取负后会高于所有真实牌力，不能当作分数使用
+        if not evaluation.hand_rank:
+            raise ValueError("评估结果没有牌力名次，无法计算总分数")
+        return -evaluation.hand_rank
     
     def compare_hands(self, eval1: HandEvaluation, eval2: HandEvaluation) -> int:
         """
@@ -331,15 +512,9 @@ class TexasHoldemEvaluator:
         Returns:
             int: 1表示eval1更大，-1表示eval2更大，0表示平局
         """
-        score1 = self._calculate_total_score(eval1)
-        score2 = self._calculate_total_score(eval2)
-        
-        if score1 > score2:
-            return 1
-        elif score1 < score2:
-            return -1
-        else:
-            return 0
+        key1 = eval1.sort_key
+        key2 = eval2.sort_key
+        return (key1 > key2) - (key1 < key2)
 
 
 # 创建全局评估器实例